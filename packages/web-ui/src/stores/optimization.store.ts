@@ -139,9 +139,24 @@ function normaliseDirectivity(raw: unknown): HybridDirectivity | undefined {
   }
 }
 
+function historyRows(columns: Record<string, unknown>): unknown[] | undefined {
+  const iters = columns.iter
+  if (!Array.isArray(iters)) return undefined
+  const losses = Array.isArray(columns.loss) ? columns.loss : []
+  const grads = Array.isArray(columns.gradNorm) ? columns.gradNorm : []
+  return iters.map((iter, index) => ({ iter, loss: losses[index], gradNorm: grads[index] }))
+}
+
 function normaliseHistory(entries: unknown): IterationMetrics[] | undefined {
-  if (!Array.isArray(entries)) return undefined
-  const mapped = entries
+  // The gateway sends history column-wise ({ iter: [...], loss: [...], gradNorm: [...] });
+  // runs persisted before that change still carry one object per iteration.
+  const rows = Array.isArray(entries)
+    ? entries
+    : entries && typeof entries === 'object'
+      ? historyRows(entries as Record<string, unknown>)
+      : undefined
+  if (!rows) return undefined
+  const mapped = rows
     .map((entry) => {
       if (!entry || typeof entry !== 'object') return undefined
       const iter = Number((entry as Record<string, unknown>).iter ?? 0)
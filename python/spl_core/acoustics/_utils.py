@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
+from itertools import islice
+from operator import itemgetter, lt
 
 
 def find_band_edges(
@@ -22,9 +24,13 @@ def find_band_edges(
     if len(frequencies) != len(values) or not frequencies:
         return (None, None)
 
-    pairs = sorted(zip(frequencies, values, strict=False), key=lambda item: item[0])
-    freqs: list[float] = [float(freq) for freq, _ in pairs]
-    mags: list[float] = [float(mag) for _, mag in pairs]
+    freqs: list[float] = list(map(float, frequencies))
+    mags: list[float] = list(map(float, values))
+    if not all(map(lt, freqs, islice(freqs, 1, None))):
+        # Solver sweeps are normally ascending already; only reorder when they are not.
+        pairs = sorted(zip(freqs, mags, strict=True), key=itemgetter(0))
+        freqs = [freq for freq, _ in pairs]
+        mags = [mag for _, mag in pairs]
 
     peak_val = max(mags)
     threshold = peak_val - drop_db
@@ -182,8 +182,8 @@ class HybridSolverResult:
         payload: dict[str, Any] = {
             "frequency_hz": list(self.frequency_hz),
             "spl_db": list(self.spl_db),
-            "impedance_real": [float(z.real) for z in self.impedance_ohm],
-            "impedance_imag": [float(z.imag) for z in self.impedance_ohm],
+            "impedance_real": [z.real for z in self.impedance_ohm],
+            "impedance_imag": [z.imag for z in self.impedance_ohm],
             "cone_velocity_ms": list(self.cone_velocity_ms),
             "port_velocity_ms": list(self.port_velocity_ms),
             "voice_coil_temperature_c": list(self.voice_coil_temperature_c),
@@ -34,12 +34,17 @@ class SealedBoxResponse:
         return {
             "frequency_hz": list(self.frequency_hz),
             "spl_db": list(self.spl_db),
-            "impedance_real": [float(z.real) for z in self.impedance_ohm],
-            "impedance_imag": [float(z.imag) for z in self.impedance_ohm],
+            "impedance_real": [z.real for z in self.impedance_ohm],
+            "impedance_imag": [z.imag for z in self.impedance_ohm],
             "cone_velocity_ms": list(self.cone_velocity_ms),
             "cone_displacement_m": list(self.cone_displacement_m),
         }
 
+    def impedance_magnitude_ohm(self) -> list[float]:
+        """Return ``|Z|`` for each sample in a single C-level pass over the impedances."""
+
+        return list(map(abs, self.impedance_ohm))
+
 
 @dataclass(slots=True)
 class SealedAlignmentSummary:
@@ -103,43 +108,19 @@ class SealedBoxSolver:
     def frequency_response(self, frequencies_hz: Iterable[float], mic_distance_m: float = 1.0) -> SealedBoxResponse:
         """Compute SPL/impedance over the requested frequencies."""
 
-        freq_list: list[float] = []
-        spl_list: list[float] = []
-        imp_list: list[complex] = []
-        vel_list: list[float] = []
-        disp_list: list[float] = []
-
-        cms_total = self._cms_total
         driver = self.driver
-
-        for f in frequencies_hz:
-            if f <= 0:
-                continue
-            omega = 2 * pi * f
-
-            # Mechanical impedance of the moving system + box air load
-            zm = self._rms + 1j * (omega * driver.mms_kg - 1.0 / (omega * cms_total))
-
-            # Total electrical impedance seen by the amplifier
-            ze = driver.re_ohm + 1j * omega * driver.le_h + (driver.bl_t_m**2) / zm
-
-            current = self.drive_voltage / ze
-            force = driver.bl_t_m * current
-            velocity = force / zm
-            volume_velocity = velocity * driver.sd_m2
-
-            pressure = omega * AIR_DENSITY * abs(volume_velocity) / (2 * pi * mic_distance_m)
-            spl = 20.0 * log10(max(pressure / P_REF, 1e-12))
-
-            freq_list.append(f)
-            spl_list.append(spl)
-            imp_list.append(ze)
-            displacement = abs(velocity) / max(omega, 1e-9)
-
-            vel_list.append(abs(velocity))
-            disp_list.append(displacement)
-
-        return SealedBoxResponse(freq_list, spl_list, imp_list, vel_list, disp_list)
+        return _sealed_sweep(
+            frequencies_hz,
+            re_ohm=driver.re_ohm,
+            le_h=driver.le_h,
+            bl=driver.bl_t_m,
+            mms=driver.mms_kg,
+            rms=self._rms,
+            cms_total=self._cms_total,
+            drive_voltage=self.drive_voltage,
+            # |p| / P_REF per unit (omega * |cone velocity|), hoisted out of the sweep.
+            spl_scale=AIR_DENSITY * driver.sd_m2 / (2 * pi * mic_distance_m * P_REF),
+        )
 
     def alignment_summary(self, response: SealedBoxResponse) -> SealedAlignmentSummary:
         """Derive key alignment metrics from a previously computed response."""
@@ -173,4 +154,59 @@ class SealedBoxSolver:
         )
 
 
+def _sealed_sweep(
+    frequencies_hz: Iterable[float],
+    *,
+    re_ohm: float,
+    le_h: float,
+    bl: float,
+    mms: float,
+    rms: float,
+    cms_total: float,
+    drive_voltage: float,
+    spl_scale: float,
+) -> SealedBoxResponse:
+    """Evaluate the sealed-box network over ``frequencies_hz`` in one fused pass.
+
+    Cone speed, excursion and SPL are all derived from a single velocity
+    magnitude held in locals, and each output trace is written exactly once.
+    """
+
+    freq_list: list[float] = []
+    spl_list: list[float] = []
+    imp_list: list[complex] = []
+    vel_list: list[float] = []
+    disp_list: list[float] = []
+
+    bl_sq = bl**2
+    two_pi = 2 * pi
+
+    # Local aliases avoid a global/builtin lookup per call inside the loop.
+    _abs, _max, _log10 = abs, max, log10
+    add_freq, add_spl, add_imp = freq_list.append, spl_list.append, imp_list.append
+    add_vel, add_disp = vel_list.append, disp_list.append
+
+    for f in frequencies_hz:
+        if f <= 0:
+            continue
+        omega = two_pi * f
+
+        # Mechanical impedance of the moving system + box air load
+        zm = rms + 1j * (omega * mms - 1.0 / (omega * cms_total))
+
+        # Total electrical impedance seen by the amplifier
+        ze = re_ohm + 1j * omega * le_h + bl_sq / zm
+
+        velocity = bl * (drive_voltage / ze) / zm
+        speed = _abs(velocity)
+
+        add_freq(f)
+        add_spl(20.0 * _log10(_max(omega * speed * spl_scale, 1e-12)))
+        add_imp(ze)
+        add_vel(speed)
+        add_disp(speed / _max(omega, 1e-9))
+
+    return SealedBoxResponse(freq_list, spl_list, imp_list, vel_list, disp_list)
+
+
 __all__ = ["SealedBoxSolver", "SealedBoxResponse", "SealedAlignmentSummary"]
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 from dataclasses import dataclass
-from math import log10, pi
+from math import log10, pi, sqrt
 
 from ..drivers import AIR_DENSITY, DriverParameters, PortGeometry, VentedBoxDesign
 from ._utils import find_band_edges
@@ -26,13 +26,36 @@ class VentedBoxResponse:
         return {
             "frequency_hz": list(self.frequency_hz),
             "spl_db": list(self.spl_db),
-            "impedance_real": [float(z.real) for z in self.impedance_ohm],
-            "impedance_imag": [float(z.imag) for z in self.impedance_ohm],
+            "impedance_real": [z.real for z in self.impedance_ohm],
+            "impedance_imag": [z.imag for z in self.impedance_ohm],
             "cone_velocity_ms": list(self.cone_velocity_ms),
             "cone_displacement_m": list(self.cone_displacement_m),
             "port_velocity_ms": list(self.port_air_velocity_ms),
         }
 
+    def impedance_magnitude_ohm(self) -> list[float]:
+        """Return ``|Z|`` for each sample in a single C-level pass over the impedances."""
+
+        return list(map(abs, self.impedance_ohm))
+
+    def impedance_peaks(self, threshold_ohm: float = 0.0) -> list[float]:
+        """Return the frequencies of local impedance maxima above ``threshold_ohm``.
+
+        Each interior sample is compared against both neighbours by zipping
+        shifted slices of the magnitude trace. The first and last samples have
+        only one neighbour and are never reported, so a trace that is still
+        rising or falling at the edge of the sweep does not yield a false peak.
+        """
+
+        mags = self.impedance_magnitude_ohm()
+        return [
+            freq
+            for freq, lo, mag, hi in zip(
+                self.frequency_hz[1:-1], mags[:-2], mags[1:-1], mags[2:], strict=True
+            )
+            if mag > threshold_ohm and mag >= lo and mag >= hi
+        ]
+
 
 @dataclass(slots=True)
 class VentedAlignmentSummary:
@@ -87,13 +110,24 @@ class VentedBoxSolver:
         self._map = self._port.acoustic_mass()
         self._rap = self._port.series_resistance(self._cab_acoustic)
         self._rleak = box.leakage_resistance(self._cab_acoustic)
+        self._fb_sq = self._port.tuning_frequency_squared(self._cab_acoustic)
+        self._fb = sqrt(self._fb_sq)
 
         self._rms = driver.mechanical_resistance()
 
     def tuning_frequency(self) -> float:
-        """Return the enclosure tuning frequency (Fb)."""
+        """Return the enclosure tuning frequency (Fb).
+
+        The value is derived once during construction alongside the other lumped
+        elements, so repeated calls (e.g. from :meth:`alignment_summary`) are free.
+        """
 
-        return self._port.tuning_frequency(self._cab_acoustic)
+        return self._fb
+
+    def tuning_frequency_squared(self) -> float:
+        """Return ``Fb**2`` so parametric sweeps can compare tunings without a sqrt."""
+
+        return self._fb_sq
 
     def frequency_response(
         self,
@@ -105,56 +139,24 @@ class VentedBoxSolver:
         if mic_distance_m <= 0:
             raise ValueError("Microphone distance must be positive")
 
-        freq_list: list[float] = []
-        spl_list: list[float] = []
-        imp_list: list[complex] = []
-        cone_vel_list: list[float] = []
-        disp_list: list[float] = []
-        port_vel_list: list[float] = []
-
         driver = self.driver
-        sd_sq = driver.sd_m2**2
-        port_area = max(self._port.area_m2(), 1e-9)
-
-        for f in frequencies_hz:
-            if f <= 0:
-                continue
-
-            omega = 2 * pi * f
-
-            z_cab = 1.0 / (1j * omega * self._cab_acoustic)
-            if self._rleak is not None:
-                z_cab = 1.0 / (1.0 / z_cab + 1.0 / self._rleak)
-
-            z_port = self._rap + 1j * omega * self._map
-            z_load = 1.0 / (1.0 / z_cab + 1.0 / z_port)
-
-            z_mech = self._rms + 1j * omega * driver.mms_kg + 1.0 / (1j * omega * self._cms)
-            z_total_mech = z_mech + sd_sq * z_load
-
-            ze = driver.re_ohm + 1j * omega * driver.le_h + (driver.bl_t_m**2) / z_total_mech
-
-            current = self.drive_voltage / ze
-            force = driver.bl_t_m * current
-            cone_velocity = force / z_total_mech
-            volume_velocity = cone_velocity * driver.sd_m2
-
-            pressure = omega * AIR_DENSITY * abs(volume_velocity) / (2 * pi * mic_distance_m)
-            spl = 20.0 * log10(max(pressure / P_REF, 1e-12))
-
-            acoustic_pressure = z_load * volume_velocity
-            port_volume_velocity = acoustic_pressure / z_port
-            port_velocity = abs(port_volume_velocity) / port_area
-            displacement = abs(cone_velocity) / max(omega, 1e-9)
-
-            freq_list.append(f)
-            spl_list.append(spl)
-            imp_list.append(ze)
-            cone_vel_list.append(abs(cone_velocity))
-            disp_list.append(displacement)
-            port_vel_list.append(port_velocity)
-
-        return VentedBoxResponse(freq_list, spl_list, imp_list, cone_vel_list, disp_list, port_vel_list)
+        return _vented_sweep(
+            frequencies_hz,
+            re_ohm=driver.re_ohm,
+            le_h=driver.le_h,
+            bl=driver.bl_t_m,
+            mms=driver.mms_kg,
+            sd=driver.sd_m2,
+            rms=self._rms,
+            cms=self._cms,
+            cab=self._cab_acoustic,
+            rap=self._rap,
+            map_=self._map,
+            leak_admittance=0.0 if self._rleak is None else 1.0 / self._rleak,
+            drive_voltage=self.drive_voltage,
+            port_area=max(self._port.area_m2(), 1e-9),
+            pressure_scale=AIR_DENSITY / (2 * pi * mic_distance_m),
+        )
 
     def alignment_summary(self, response: VentedBoxResponse) -> VentedAlignmentSummary:
         max_spl = max(response.spl_db, default=0.0)
@@ -187,4 +189,85 @@ class VentedBoxSolver:
         )
 
 
+def _vented_sweep(
+    frequencies_hz: Iterable[float],
+    *,
+    re_ohm: float,
+    le_h: float,
+    bl: float,
+    mms: float,
+    sd: float,
+    rms: float,
+    cms: float,
+    cab: float,
+    rap: float,
+    map_: float,
+    leak_admittance: float,
+    drive_voltage: float,
+    port_area: float,
+    pressure_scale: float,
+) -> VentedBoxResponse:
+    """Evaluate the vented lumped network over ``frequencies_hz`` in a single pass.
+
+    The kernel only receives plain scalars so the loop runs entirely on local
+    variables, without attribute lookups on the solver or design dataclasses.
+    """
+
+    freq_list: list[float] = []
+    spl_list: list[float] = []
+    imp_list: list[complex] = []
+    cone_vel_list: list[float] = []
+    disp_list: list[float] = []
+    port_vel_list: list[float] = []
+
+    bl_sq = bl**2
+    sd_sq = sd**2
+    # |p| / P_REF per unit (omega * |cone velocity|); sd is positive so it folds in.
+    spl_scale = pressure_scale * sd / P_REF
+    two_pi = 2 * pi
+    port_scale = sd / port_area
+
+    # Local aliases avoid a global/builtin lookup per call inside the loop.
+    _abs, _max, _log10 = abs, max, log10
+    add_freq, add_spl, add_imp = freq_list.append, spl_list.append, imp_list.append
+    add_cone_vel, add_disp, add_port_vel = cone_vel_list.append, disp_list.append, port_vel_list.append
+
+    for f in frequencies_hz:
+        if f <= 0:
+            continue
+
+        omega = two_pi * f
+        jw = 1j * omega
+
+        y_cab = jw * cab + leak_admittance
+        z_port = rap + jw * map_
+        z_load = 1.0 / (y_cab + 1.0 / z_port)
+
+        z_mech = rms + jw * mms + 1.0 / (jw * cms)
+        z_total_mech = z_mech + sd_sq * z_load
+
+        ze = re_ohm + jw * le_h + bl_sq / z_total_mech
+
+        current = drive_voltage / ze
+        force = bl * current
+        cone_velocity = force / z_total_mech
+        speed = _abs(cone_velocity)
+
+        spl = 20.0 * _log10(_max(omega * speed * spl_scale, 1e-12))
+
+        # |U_port| = |z_load / z_port| * Sd * |u| and z_load / z_port = 1 / (1 + z_port * y_cab),
+        # so only the real magnitude of the divider is needed.
+        port_velocity = speed * port_scale / _abs(1.0 + z_port * y_cab)
+        displacement = speed / _max(omega, 1e-9)
+
+        add_freq(f)
+        add_spl(spl)
+        add_imp(ze)
+        add_cone_vel(speed)
+        add_disp(displacement)
+        add_port_vel(port_velocity)
+
+    return VentedBoxResponse(freq_list, spl_list, imp_list, cone_vel_list, disp_list, port_vel_list)
+
+
 __all__ = ["VentedBoxSolver", "VentedBoxResponse", "VentedAlignmentSummary"]
@@ -10,7 +10,7 @@ AIR_DENSITY = 1.2041  # kg/m^3 at 20°C
 SPEED_OF_SOUND = 343.0  # m/s at 20°C
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class DriverParameters:
     """Minimal Thiele/Small parameter set for low-frequency simulations."""
 
@@ -125,7 +125,7 @@ class DriverParameters:
         return curve
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class BoxDesign:
     """Parameters describing a sealed enclosure."""
 
@@ -146,7 +146,7 @@ class BoxDesign:
         return self.volume_m3() / (AIR_DENSITY * SPEED_OF_SOUND**2 * driver.sd_m2**2)
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class PortGeometry:
     """Simple representation of a circular port."""
 
@@ -186,11 +186,19 @@ class PortGeometry:
             raise ValueError("Port area must be positive")
         return AIR_DENSITY * self.effective_length_m() / area
 
+    def tuning_frequency_squared(self, cab_acoustic: float) -> float:
+        """Return ``Fb**2`` (Hz²) without taking a square root.
+
+        Useful when screening many candidate enclosures against a target tuning,
+        where comparing squared frequencies is sufficient.
+        """
+
+        return 1.0 / ((2 * pi) ** 2 * self.acoustic_mass() * cab_acoustic)
+
     def tuning_frequency(self, cab_acoustic: float) -> float:
         """Return the box tuning frequency derived from Map and acoustic Cab."""
 
-        omega0 = 1.0 / sqrt(self.acoustic_mass() * cab_acoustic)
-        return omega0 / (2 * pi)
+        return sqrt(self.tuning_frequency_squared(cab_acoustic))
 
     def series_resistance(self, cab_acoustic: float) -> float:
         """Return an approximate acoustic resistance modelling port losses."""
@@ -200,7 +208,7 @@ class PortGeometry:
         return omega0 * self.acoustic_mass() / loss_q
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class VentedBoxDesign:
     """Parameters describing a bass-reflex (vented) enclosure."""
 
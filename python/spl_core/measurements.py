@@ -9,7 +9,7 @@ import zipfile
 from bisect import bisect_left, bisect_right
 from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
-from typing import Any, TextIO
+from typing import Any, BinaryIO, TextIO, cast
 
 from .acoustics.sealed import SealedBoxResponse
 from .acoustics.vented import VentedBoxResponse
@@ -32,8 +32,8 @@ class MeasurementTrace:
         if self.phase_deg is not None:
             payload["phase_deg"] = list(self.phase_deg)
         if self.impedance_ohm is not None:
-            payload["impedance_real"] = [float(z.real) for z in self.impedance_ohm]
-            payload["impedance_imag"] = [float(z.imag) for z in self.impedance_ohm]
+            payload["impedance_real"] = [z.real for z in self.impedance_ohm]
+            payload["impedance_imag"] = [z.imag for z in self.impedance_ohm]
         if self.thd_percent is not None:
             payload["thd_percent"] = list(self.thd_percent)
         return payload
@@ -122,8 +122,8 @@ class MeasurementTrace:
 
         impedance = None
         if self.impedance_ohm is not None:
-            real = [float(z.real) for z in self.impedance_ohm]
-            imag = [float(z.imag) for z in self.impedance_ohm]
+            real = [z.real for z in self.impedance_ohm]
+            imag = [z.imag for z in self.impedance_ohm]
             smooth_real = _apply(real, "impedance_ohm")
             smooth_imag = _apply(imag, "impedance_ohm")
             if smooth_real is not None and smooth_imag is not None:
@@ -244,18 +244,22 @@ def measurement_from_response(response: SealedBoxResponse | VentedBoxResponse) -
     )
 
 
-def parse_klippel_dat(payload: str | TextIO) -> MeasurementTrace:
-    if isinstance(payload, str):
-        text = payload
-    else:
-        text = payload.read()
+def parse_klippel_dat(payload: str | TextIO | Iterable[str]) -> MeasurementTrace:
+    """Parse a Klippel ``.dat`` export.
+
+    ``payload`` may be the full text, a text stream or any iterable of lines.
+    Streams are consumed line by line so large exports are never held in memory
+    as a single string.
+    """
+
+    lines: Iterable[str] = payload.splitlines() if isinstance(payload, str) else payload
     freq: list[float] = []
     spl: list[float] = []
     phase: list[float | None] | None = None
-    imp_real: list[float | None] | None = None
-    imp_imag: list[float | None] | None = None
+    imp_real: list[float] | None = None
+    imp_imag: list[float] | None = None
 
-    for row in _normalise_lines(text):
+    for row in _normalise_lines(lines):
         if not row:
             continue
         try:
@@ -276,24 +280,22 @@ def parse_klippel_dat(payload: str | TextIO) -> MeasurementTrace:
             phase.append(math.nan)
 
         if len(row) > 4:
-            imp_real = imp_real or [None] * (len(freq) - 1)
-            imp_imag = imp_imag or [None] * (len(freq) - 1)
+            # Pad earlier rows with NaN directly so the columns stay plain floats.
+            imp_real = imp_real or [math.nan] * (len(freq) - 1)
+            imp_imag = imp_imag or [math.nan] * (len(freq) - 1)
             try:
-                imp_real.append(float(row[3]))
-                imp_imag.append(float(row[4]))
+                real, imag = float(row[3]), float(row[4])
             except ValueError:
-                imp_real.append(math.nan)
-                imp_imag.append(math.nan)
+                real = imag = math.nan
+            imp_real.append(real)
+            imp_imag.append(imag)
         elif imp_real is not None and imp_imag is not None:
             imp_real.append(math.nan)
             imp_imag.append(math.nan)
 
     impedance: list[complex] | None = None
     if imp_real is not None and imp_imag is not None:
-        impedance = [
-            complex(_coalesce(real), _coalesce(imag))
-            for real, imag in zip(imp_real, imp_imag, strict=True)
-        ]
+        impedance = list(map(complex, imp_real, imp_imag))
 
     return MeasurementTrace(
         frequency_hz=freq,
@@ -303,36 +305,43 @@ def parse_klippel_dat(payload: str | TextIO) -> MeasurementTrace:
     )
 
 
-def parse_rew_mdat(payload: bytes | bytearray | str | TextIO) -> MeasurementTrace:
-    raw: bytes
+def parse_rew_mdat(payload: bytes | bytearray | str | TextIO | BinaryIO) -> MeasurementTrace:
+    """Parse a REW ``.mdat`` archive.
+
+    Seekable binary streams (for example spooled uploads) are handed to
+    :mod:`zipfile` directly, so the archive is read in place rather than copied
+    into memory first.
+    """
+
+    source: BinaryIO
     if isinstance(payload, bytes | bytearray):
-        raw = bytes(payload)
+        source = io.BytesIO(payload)
     elif isinstance(payload, str):
-        raw = payload.encode("utf-8")
+        source = io.BytesIO(payload.encode("utf-8"))
+    elif isinstance(payload, io.TextIOBase):
+        source = io.BytesIO(payload.read().encode("utf-8"))
     else:
-        raw = payload.read().encode("utf-8")
-    buffer = io.BytesIO(raw)
-    with zipfile.ZipFile(buffer) as archive:
+        source = cast(BinaryIO, payload)
+    with zipfile.ZipFile(source) as archive:
         name = _select_payload_name(archive.namelist())
         with archive.open(name) as handle:
-            content = handle.read()
-    if name.lower().endswith(".json"):
-        data = json.loads(content.decode("utf-8"))
-        payload_dict = data.get("measurement", data)
-        freq = _as_float_list(payload_dict.get("frequency"))
-        spl = _as_float_list(payload_dict.get("spl"))
-        if freq is None or spl is None:
-            raise ValueError("JSON payload missing frequency/SPL arrays")
-        phase = _as_float_list(payload_dict.get("phase"))
-        imp_real = _as_float_list(payload_dict.get("impedance_real"))
-        imp_imag = _as_float_list(payload_dict.get("impedance_imag"))
-    else:
-        text = content.decode("utf-8")
-        trace = parse_klippel_dat(text)
-        return trace
+            if not name.lower().endswith(".json"):
+                return parse_klippel_dat(io.TextIOWrapper(handle, encoding="utf-8"))
+            data = json.load(handle)
+
+    payload_dict = data.get("measurement", data)
+    freq = _as_float_list(payload_dict.get("frequency"))
+    spl = _as_float_list(payload_dict.get("spl"))
+    if freq is None or spl is None:
+        raise ValueError("JSON payload missing frequency/SPL arrays")
+    phase = _as_float_list(payload_dict.get("phase"))
+    imp_real = _as_float_list(payload_dict.get("impedance_real"))
+    imp_imag = _as_float_list(payload_dict.get("impedance_imag"))
 
     if imp_real is not None and imp_imag is not None:
-        impedance = [complex(r, i) for r, i in zip(imp_real, imp_imag, strict=True)]
+        if len(imp_real) != len(imp_imag):
+            raise ValueError("Impedance real and imaginary arrays must be the same length")
+        impedance = list(map(complex, imp_real, imp_imag))
     elif imp_real is None and imp_imag is None:
         impedance = None
     else:
@@ -385,27 +394,28 @@ def compare_measurement_to_prediction(
     min_freq = float(min(measurement_for_stats.frequency_hz))
     max_freq = float(max(measurement_for_stats.frequency_hz))
 
+    spl_valid = _finite(spl_delta)
+    spl_abs_sorted = None if spl_valid is None else sorted(map(abs, spl_valid))
+    spl_pairs = _finite_pairs(measurement_for_stats.spl_db, prediction_for_stats.spl_db)
+    spl_bias = _mean(spl_valid)
+
     stats = MeasurementStats(
         sample_count=len(measurement_for_stats.frequency_hz),
         minimum_frequency_hz=min_freq,
         maximum_frequency_hz=max_freq,
-        spl_rmse_db=_rmse(spl_delta),
-        spl_mae_db=_mae(spl_delta),
-        spl_bias_db=_mean(spl_delta),
-        spl_median_abs_dev_db=_median_abs_deviation(spl_delta),
-        spl_std_dev_db=_stddev(spl_delta),
-        spl_pearson_r=_pearson_correlation(
-            measurement_for_stats.spl_db, prediction_for_stats.spl_db
-        ),
-        spl_r_squared=_coefficient_of_determination(
-            measurement_for_stats.spl_db, prediction_for_stats.spl_db
-        ),
-        spl_p95_abs_error_db=_percentile_abs(spl_delta, 0.95),
-        spl_highest_delta_db=_max_value(spl_delta),
-        spl_lowest_delta_db=_min_value(spl_delta),
-        max_spl_delta_db=_max_abs(spl_delta),
-        phase_rmse_deg=_rmse(phase_delta),
-        impedance_mag_rmse_ohm=_rmse(impedance_delta),
+        spl_rmse_db=_rmse(spl_valid),
+        spl_mae_db=_mae(spl_valid),
+        spl_bias_db=spl_bias,
+        spl_median_abs_dev_db=_median_abs_deviation(spl_valid),
+        spl_std_dev_db=_stddev(spl_valid),
+        spl_pearson_r=_pearson_correlation(spl_pairs),
+        spl_r_squared=_coefficient_of_determination(spl_pairs),
+        spl_p95_abs_error_db=_percentile_sorted(spl_abs_sorted, 0.95),
+        spl_highest_delta_db=max(spl_valid) if spl_valid else None,
+        spl_lowest_delta_db=min(spl_valid) if spl_valid else None,
+        max_spl_delta_db=spl_abs_sorted[-1] if spl_abs_sorted else None,
+        phase_rmse_deg=_rmse(_finite(phase_delta)),
+        impedance_mag_rmse_ohm=_rmse(_finite(impedance_delta)),
     )
 
     delta = MeasurementDelta(
@@ -419,6 +429,7 @@ def compare_measurement_to_prediction(
         spl_delta,
         measurement_original.spl_db,
         prediction_resampled.spl_db,
+        overall_bias=spl_bias,
         port_length_m=port_length_m,
     )
     return delta, stats, diagnosis
@@ -427,8 +438,8 @@ def compare_measurement_to_prediction(
 # --- helpers -----------------------------------------------------------------
 
 
-def _normalise_lines(text: str) -> Iterable[list[str]]:
-    for raw in text.splitlines():
+def _normalise_lines(lines: Iterable[str]) -> Iterable[list[str]]:
+    for raw in lines:
         line = raw.strip()
         if not line or line.startswith("#"):
             continue
@@ -543,31 +554,52 @@ def _impedance_delta(
     return [abs(m) - abs(p) for m, p in zip(measurement, prediction, strict=True)]
 
 
-def _rmse(values: Sequence[float] | None) -> float | None:
+def _finite(values: Sequence[float] | None) -> list[float] | None:
+    """Drop NaN samples once so every statistic can share the filtered series."""
+
     if values is None:
         return None
-    valid = [v for v in values if not math.isnan(v)]
+    return [v for v in values if not math.isnan(v)]
+
+
+def _finite_pairs(
+    measurement: Sequence[float] | None,
+    prediction: Sequence[float] | None,
+) -> list[tuple[float, float]] | None:
+    if measurement is None or prediction is None:
+        return None
+    pairs: list[tuple[float, float]] = []
+    for meas, pred in zip(measurement, prediction, strict=True):
+        if meas is None or pred is None:
+            continue
+        m_val = float(meas)
+        p_val = float(pred)
+        if math.isnan(m_val) or math.isnan(p_val):
+            continue
+        pairs.append((m_val, p_val))
+    return pairs
+
+
+# The statistics below expect series already passed through ``_finite`` (or
+# ``_finite_pairs``), so a single NaN sweep serves every figure derived from it.
+
+
+def _rmse(valid: Sequence[float] | None) -> float | None:
     if not valid:
         return None
     return math.sqrt(sum(v * v for v in valid) / len(valid))
 
 
-def _mean(values: Sequence[float] | None) -> float | None:
-    if values is None:
-        return None
-    valid = [v for v in values if not math.isnan(v)]
+def _mean(valid: Sequence[float] | None) -> float | None:
     if not valid:
         return None
     return sum(valid) / len(valid)
 
 
-def _mae(values: Sequence[float] | None) -> float | None:
-    if values is None:
-        return None
-    valid = [abs(v) for v in values if not math.isnan(v)]
+def _mae(valid: Sequence[float] | None) -> float | None:
     if not valid:
         return None
-    return sum(valid) / len(valid)
+    return sum(map(abs, valid)) / len(valid)
 
 
 def _median(values: Sequence[float]) -> float:
@@ -578,23 +610,14 @@ def _median(values: Sequence[float]) -> float:
     return 0.5 * (ordered[mid - 1] + ordered[mid])
 
 
-def _median_abs_deviation(values: Sequence[float] | None) -> float | None:
-    if values is None:
-        return None
-    valid = [v for v in values if not math.isnan(v)]
+def _median_abs_deviation(valid: Sequence[float] | None) -> float | None:
     if not valid:
         return None
     centre = _median(valid)
-    deviations = [abs(value - centre) for value in valid]
-    if not deviations:
-        return 0.0
-    return _median(deviations)
+    return _median([abs(value - centre) for value in valid])
 
 
-def _stddev(values: Sequence[float] | None) -> float | None:
-    if values is None:
-        return None
-    valid = [v for v in values if not math.isnan(v)]
+def _stddev(valid: Sequence[float] | None) -> float | None:
     if not valid:
         return None
     if len(valid) == 1:
@@ -604,22 +627,8 @@ def _stddev(values: Sequence[float] | None) -> float | None:
     return math.sqrt(variance)
 
 
-def _pearson_correlation(
-    measurement: Sequence[float] | None,
-    prediction: Sequence[float] | None,
-) -> float | None:
-    if measurement is None or prediction is None:
-        return None
-    pairs: list[tuple[float, float]] = []
-    for meas, pred in zip(measurement, prediction, strict=True):
-        if meas is None or pred is None:
-            continue
-        m_val = float(meas)
-        p_val = float(pred)
-        if math.isnan(m_val) or math.isnan(p_val):
-            continue
-        pairs.append((m_val, p_val))
-    if len(pairs) < 2:
+def _pearson_correlation(pairs: Sequence[tuple[float, float]] | None) -> float | None:
+    if pairs is None or len(pairs) < 2:
         return None
     mean_meas = math.fsum(value[0] for value in pairs) / len(pairs)
     mean_pred = math.fsum(value[1] for value in pairs) / len(pairs)
@@ -632,22 +641,8 @@ def _pearson_correlation(
     return cov / denom
 
 
-def _coefficient_of_determination(
-    measurement: Sequence[float] | None,
-    prediction: Sequence[float] | None,
-) -> float | None:
-    if measurement is None or prediction is None:
-        return None
-    pairs: list[tuple[float, float]] = []
-    for meas, pred in zip(measurement, prediction, strict=True):
-        if meas is None or pred is None:
-            continue
-        m_val = float(meas)
-        p_val = float(pred)
-        if math.isnan(m_val) or math.isnan(p_val):
-            continue
-        pairs.append((m_val, p_val))
-    if len(pairs) < 2:
+def _coefficient_of_determination(pairs: Sequence[tuple[float, float]] | None) -> float | None:
+    if pairs is None or len(pairs) < 2:
         return None
     mean_meas = math.fsum(value[0] for value in pairs) / len(pairs)
     ss_tot = math.fsum((m - mean_meas) ** 2 for m, _ in pairs)
@@ -657,56 +652,20 @@ def _coefficient_of_determination(
     return 1.0 - (ss_res / ss_tot)
 
 
-def _max_abs(values: Sequence[float] | None) -> float | None:
-    if values is None:
-        return None
-    valid = [abs(v) for v in values if not math.isnan(v)]
-    if not valid:
-        return None
-    return max(valid)
-
-
-def _max_value(values: Sequence[float] | None) -> float | None:
-    if values is None:
-        return None
-    best: float | None = None
-    for value in values:
-        if math.isnan(value):
-            continue
-        if best is None or value > best:
-            best = value
-    return best
-
-
-def _min_value(values: Sequence[float] | None) -> float | None:
-    if values is None:
-        return None
-    best: float | None = None
-    for value in values:
-        if math.isnan(value):
-            continue
-        if best is None or value < best:
-            best = value
-    return best
-
-
-def _percentile_abs(values: Sequence[float] | None, percentile: float) -> float | None:
-    if values is None:
-        return None
-    valid = sorted(abs(v) for v in values if not math.isnan(v))
-    if not valid:
+def _percentile_sorted(ordered: Sequence[float] | None, percentile: float) -> float | None:
+    if not ordered:
         return None
     if percentile <= 0.0:
-        return valid[0]
+        return ordered[0]
     if percentile >= 1.0:
-        return valid[-1]
-    position = percentile * (len(valid) - 1)
+        return ordered[-1]
+    position = percentile * (len(ordered) - 1)
     lower = math.floor(position)
     upper = math.ceil(position)
     if lower == upper:
-        return valid[lower]
+        return ordered[lower]
     weight = position - lower
-    return valid[lower] * (1.0 - weight) + valid[upper] * weight
+    return ordered[lower] * (1.0 - weight) + ordered[upper] * weight
 
 
 def _band_mean(
@@ -752,9 +711,9 @@ def _diagnose_bias(
     measurement_spl: Sequence[float] | None,
     predicted_spl: Sequence[float] | None,
     *,
+    overall_bias: float | None,
     port_length_m: float | None,
 ) -> MeasurementDiagnosis:
-    overall_bias = _mean(spl_delta)
     level_trim = -overall_bias if overall_bias is not None else None
 
     low_bias = _band_mean(frequency, spl_delta, low=None, high=45.0)
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Mapping, MutableMapping, Sequence
-from dataclasses import asdict, dataclass, replace
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from concurrent.futures import Executor
+from dataclasses import asdict, dataclass, field, replace
 from math import ceil, floor
 from random import Random
 from statistics import mean, pstdev
@@ -255,30 +256,38 @@ def _assess_risk(
     return rating, tuple(factors)
 
 
-def _sealed_report(
+@dataclass(slots=True)
+class _SampleBatch:
+    """Raw Monte Carlo samples gathered by one (possibly remote) chunk of iterations."""
+
+    metrics: dict[str, list[float]] = field(default_factory=dict)
+    excursion_failures: int = 0
+    port_failures: int = 0
+
+    def record(self, summary_dict: Mapping[str, object]) -> None:
+        for key, value in summary_dict.items():
+            if isinstance(value, int | float):
+                self.metrics.setdefault(key, []).append(float(value))
+
+    def merge(self, other: _SampleBatch) -> None:
+        for key, values in other.metrics.items():
+            self.metrics.setdefault(key, []).extend(values)
+        self.excursion_failures += other.excursion_failures
+        self.port_failures += other.port_failures
+
+
+def _sample_sealed(
     driver: DriverParameters,
     design: BoxDesign,
     frequencies_hz: Sequence[float],
-    iterations: int,
     spec: ToleranceSpec,
-    rng: Random,
     drive_voltage: float,
     mic_distance_m: float,
     excursion_limit_ratio: float,
-) -> ToleranceReport:
-    solver = SealedBoxSolver(driver, design, drive_voltage=drive_voltage)
-    response = solver.frequency_response(frequencies_hz, mic_distance_m)
-    baseline = solver.alignment_summary(response)
-    baseline_dict = baseline.to_dict()
-
-    metrics: MutableMapping[str, list[float]] = {}
-    excursion_failures = 0
-
-    def record_metric(name: str, value: float | None) -> None:
-        if value is None:
-            return
-        metrics.setdefault(name, []).append(float(value))
-
+    iterations: int,
+    rng: Random,
+) -> _SampleBatch:
+    batch = _SampleBatch()
     for _ in range(iterations):
         varied_driver = _vary_driver(driver, spec, rng)
         varied_design = _vary_box(design, spec, rng)
@@ -286,16 +295,111 @@ def _sealed_report(
         varied_response = varied_solver.frequency_response(frequencies_hz, mic_distance_m)
         summary = varied_solver.alignment_summary(varied_response)
 
-        for key, value in summary.to_dict().items():
-            if isinstance(value, int | float):
-                record_metric(key, value)
+        batch.record(summary.to_dict())
+        if summary.excursion_ratio is not None and summary.excursion_ratio > excursion_limit_ratio:
+            batch.excursion_failures += 1
+    return batch
+
 
+def _sample_vented(
+    driver: DriverParameters,
+    design: VentedBoxDesign,
+    frequencies_hz: Sequence[float],
+    spec: ToleranceSpec,
+    drive_voltage: float,
+    mic_distance_m: float,
+    excursion_limit_ratio: float,
+    port_velocity_limit_ms: float | None,
+    iterations: int,
+    rng: Random,
+) -> _SampleBatch:
+    batch = _SampleBatch()
+    for _ in range(iterations):
+        varied_driver = _vary_driver(driver, spec, rng)
+        varied_design = _vary_vented_box(design, spec, rng)
+        varied_solver = VentedBoxSolver(varied_driver, varied_design, drive_voltage=drive_voltage)
+        varied_response = varied_solver.frequency_response(frequencies_hz, mic_distance_m)
+        summary = varied_solver.alignment_summary(varied_response)
+
+        batch.record(summary.to_dict())
         if summary.excursion_ratio is not None and summary.excursion_ratio > excursion_limit_ratio:
-            excursion_failures += 1
+            batch.excursion_failures += 1
+        if port_velocity_limit_ms is not None and summary.max_port_velocity_ms > port_velocity_limit_ms:
+            batch.port_failures += 1
+    return batch
+
+
+def _sample_chunk(
+    sampler: Callable[..., _SampleBatch],
+    args: tuple[object, ...],
+    iterations: int,
+    seed: int,
+) -> _SampleBatch:
+    return sampler(*args, iterations, Random(seed))
+
+
+def _collect_samples(
+    sampler: Callable[..., _SampleBatch],
+    args: tuple[object, ...],
+    iterations: int,
+    rng: Random,
+    executor: Executor | None,
+    chunks: int,
+) -> _SampleBatch:
+    """Run ``iterations`` samples inline, or split them across ``executor`` workers.
+
+    Parallel chunks draw from independent generators seeded from ``rng`` so a
+    seeded run stays reproducible for a given chunk count; the raw samples are
+    merged in chunk order before any statistics are computed.
+    """
+
+    chunks = min(chunks, iterations)
+    if executor is None or chunks <= 1:
+        return sampler(*args, iterations, rng)
+
+    base, extra = divmod(iterations, chunks)
+    sizes = [base + (1 if index < extra else 0) for index in range(chunks)]
+    seeds = [rng.getrandbits(64) for _ in sizes]
+    futures = [
+        executor.submit(_sample_chunk, sampler, args, size, seed)
+        for size, seed in zip(sizes, seeds, strict=True)
+    ]
+    merged = _SampleBatch()
+    for future in futures:
+        merged.merge(future.result())
+    return merged
 
-    metric_stats = _summarise_metrics(metrics)
-    worst_case_delta = _worst_case_delta(baseline_dict, metrics)
-    excursion_rate = excursion_failures / iterations
+
+def _sealed_report(
+    driver: DriverParameters,
+    design: BoxDesign,
+    frequencies_hz: Sequence[float],
+    iterations: int,
+    spec: ToleranceSpec,
+    rng: Random,
+    drive_voltage: float,
+    mic_distance_m: float,
+    excursion_limit_ratio: float,
+    executor: Executor | None,
+    chunks: int,
+) -> ToleranceReport:
+    solver = SealedBoxSolver(driver, design, drive_voltage=drive_voltage)
+    response = solver.frequency_response(frequencies_hz, mic_distance_m)
+    baseline = solver.alignment_summary(response)
+    baseline_dict = baseline.to_dict()
+
+    batch = _collect_samples(
+        _sample_sealed,
+        (driver, design, frequencies_hz, spec, drive_voltage, mic_distance_m, excursion_limit_ratio),
+        iterations,
+        rng,
+        executor,
+        chunks,
+    )
+
+    metric_stats = _summarise_metrics(batch.metrics)
+    worst_case_delta = _worst_case_delta(baseline_dict, batch.metrics)
+    excursion_rate = batch.excursion_failures / iterations
 
     risk_rating, risk_factors = _assess_risk(
         excursion_rate=excursion_rate,
@@ -332,41 +436,36 @@ def _vented_report(
     mic_distance_m: float,
     excursion_limit_ratio: float,
     port_velocity_limit_ms: float | None,
+    executor: Executor | None,
+    chunks: int,
 ) -> ToleranceReport:
     solver = VentedBoxSolver(driver, design, drive_voltage=drive_voltage)
     response = solver.frequency_response(frequencies_hz, mic_distance_m)
     baseline = solver.alignment_summary(response)
     baseline_dict = baseline.to_dict()
 
-    metrics: MutableMapping[str, list[float]] = {}
-    excursion_failures = 0
-    port_failures = 0
-
-    def record_metric(name: str, value: float | None) -> None:
-        if value is None:
-            return
-        metrics.setdefault(name, []).append(float(value))
-
-    for _ in range(iterations):
-        varied_driver = _vary_driver(driver, spec, rng)
-        varied_design = _vary_vented_box(design, spec, rng)
-        varied_solver = VentedBoxSolver(varied_driver, varied_design, drive_voltage=drive_voltage)
-        varied_response = varied_solver.frequency_response(frequencies_hz, mic_distance_m)
-        summary = varied_solver.alignment_summary(varied_response)
-
-        for key, value in summary.to_dict().items():
-            if isinstance(value, int | float):
-                record_metric(key, value)
-
-        if summary.excursion_ratio is not None and summary.excursion_ratio > excursion_limit_ratio:
-            excursion_failures += 1
-        if port_velocity_limit_ms is not None and summary.max_port_velocity_ms > port_velocity_limit_ms:
-            port_failures += 1
+    batch = _collect_samples(
+        _sample_vented,
+        (
+            driver,
+            design,
+            frequencies_hz,
+            spec,
+            drive_voltage,
+            mic_distance_m,
+            excursion_limit_ratio,
+            port_velocity_limit_ms,
+        ),
+        iterations,
+        rng,
+        executor,
+        chunks,
+    )
 
-    metric_stats = _summarise_metrics(metrics)
-    worst_case_delta = _worst_case_delta(baseline_dict, metrics)
-    excursion_rate = excursion_failures / iterations
-    port_rate = None if port_velocity_limit_ms is None else port_failures / iterations
+    metric_stats = _summarise_metrics(batch.metrics)
+    worst_case_delta = _worst_case_delta(baseline_dict, batch.metrics)
+    excursion_rate = batch.excursion_failures / iterations
+    port_rate = None if port_velocity_limit_ms is None else batch.port_failures / iterations
 
     risk_rating, risk_factors = _assess_risk(
         excursion_rate=excursion_rate,
@@ -405,11 +504,19 @@ def run_tolerance_analysis(
     mic_distance_m: float = 1.0,
     excursion_limit_ratio: float = 1.0,
     port_velocity_limit_ms: float | None = None,
+    executor: Executor | None = None,
+    chunks: int = 1,
 ) -> ToleranceReport:
-    """Run a Monte Carlo sweep returning aggregated statistics for the alignment."""
+    """Run a Monte Carlo sweep returning aggregated statistics for the alignment.
+
+    When ``executor`` is provided the iterations are split into ``chunks`` batches
+    that run on its workers; raw samples are merged before statistics are taken.
+    """
 
     if iterations <= 0:
         raise ValueError("iterations must be positive")
+    if chunks <= 0:
+        raise ValueError("chunks must be positive")
     if not frequencies_hz:
         raise ValueError("frequencies_hz must not be empty")
 
@@ -429,6 +536,8 @@ def run_tolerance_analysis(
             drive_voltage,
             mic_distance_m,
             excursion_limit_ratio,
+            executor,
+            chunks,
         )
     if alignment == "vented":
         if not isinstance(design, VentedBoxDesign):
@@ -444,6 +553,8 @@ def run_tolerance_analysis(
             mic_distance_m,
             excursion_limit_ratio,
             port_velocity_limit_ms,
+            executor,
+            chunks,
         )
     raise ValueError("alignment must be 'sealed' or 'vented'")
 
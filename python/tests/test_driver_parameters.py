@@ -8,8 +8,11 @@ from spl_core import DEFAULT_DRIVER, DriverParameters, recommended_vented_alignm
 
 
 class DriverParameterUtilitiesTest(unittest.TestCase):
-    def setUp(self) -> None:
-        self.driver = DriverParameters(
+    driver: DriverParameters
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.driver = DriverParameters(
             fs_hz=32.0,
             qts=0.35,
             re_ohm=5.4,
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from typing import Any
+from unittest import mock
+
+from services.gateway.app import main as gateway
+from services.gateway.app.store import RunStore
+
+TestClient: Any
+try:
+    from fastapi.testclient import TestClient as _TestClient
+except ImportError:  # pragma: no cover - fastapi or httpx not installed
+    TestClient = None
+else:
+    TestClient = _TestClient
+
+SEALED_BODY = {
+    "driver": {
+        "fs_hz": 30.0,
+        "qts": 0.37,
+        "vas_l": 80.0,
+        "re_ohm": 3.6,
+        "bl_t_m": 15.8,
+        "mms_kg": 0.128,
+        "sd_m2": 0.054,
+    },
+    "box": {"volume_l": 50.0},
+    "frequencies_hz": [20.0, 40.0, 80.0, 160.0],
+}
+
+
+def _refs(node: Any) -> set[str]:
+    if isinstance(node, dict):
+        found = {node["$ref"]} if "$ref" in node else set()
+        for value in node.values():
+            found |= _refs(value)
+        return found
+    if isinstance(node, list):
+        return set().union(*map(_refs, node)) if node else set()
+    return set()
+
+
+@unittest.skipIf(getattr(gateway, "app", None) is None, "fastapi is not installed")
+class OpenApiDocumentTests(unittest.TestCase):
+    def test_raw_body_routes_reference_component_schemas(self) -> None:
+        document = gateway.app.openapi()
+        schemas = document["components"]["schemas"]
+
+        for path, model in (
+            ("/simulate/sealed", "SealedRequest"),
+            ("/simulate/vented", "VentedRequest"),
+            ("/simulate/hybrid", "HybridRequest"),
+            ("/measurements/sealed/compare", "SealedMeasurementRequest"),
+            ("/measurements/vented/compare", "VentedMeasurementRequest"),
+        ):
+            operation = document["paths"][path]["post"]
+            body = operation["requestBody"]["content"]["application/json"]["schema"]
+            self.assertEqual(body, {"$ref": f"#/components/schemas/{model}"})
+            self.assertIn("422", operation["responses"])
+            self.assertIn(model, schemas)
+        self.assertIn("MeasurementData", schemas)
+
+        for ref in _refs(document):
+            self.assertTrue(ref.startswith("#/components/schemas/"), ref)
+            self.assertIn(ref.rsplit("/", 1)[-1], schemas)
+
+
+@unittest.skipIf(TestClient is None, "fastapi test client is not installed")
+class CachedJsonResponseTests(unittest.TestCase):
+    client: Any
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.client = TestClient(gateway.app)
+        cls.client.__enter__()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.client.__exit__(None, None, None)
+
+    def test_repeated_body_reuses_etag_and_cached_bytes(self) -> None:
+        first = self.client.post("/simulate/sealed", json=SEALED_BODY)
+        self.assertEqual(first.status_code, 200)
+        etag = first.headers["etag"]
+        self.assertIn("spl_db", first.json())
+
+        repeat = self.client.post("/simulate/sealed", json=SEALED_BODY)
+        self.assertEqual(repeat.status_code, 200)
+        self.assertEqual(repeat.headers["etag"], etag)
+        self.assertEqual(repeat.content, first.content)
+
+        conditional = self.client.post(
+            "/simulate/sealed", json=SEALED_BODY, headers={"If-None-Match": etag}
+        )
+        self.assertEqual(conditional.status_code, 200)
+        self.assertEqual(conditional.headers["etag"], etag)
+        self.assertEqual(conditional.content, first.content)
+
+    def test_malformed_json_is_rejected_with_422(self) -> None:
+        response = self.client.post(
+            "/simulate/sealed",
+            content=b'{"driver": ',
+            headers={"Content-Type": "application/json"},
+        )
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(response.json()["detail"][0]["loc"][0], "body")
+
+    def test_missing_field_is_reported_under_body(self) -> None:
+        body = {key: value for key, value in SEALED_BODY.items() if key != "box"}
+        response = self.client.post("/simulate/sealed", json=body)
+        self.assertEqual(response.status_code, 422)
+        locations = [error["loc"] for error in response.json()["detail"]]
+        self.assertIn(["body", "box"], locations)
+
+
+@unittest.skipIf(TestClient is None, "fastapi test client is not installed")
+class OptimisationEndpointTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.NamedTemporaryFile(delete=False)
+        self._tmp.close()
+        self.store = RunStore(self._tmp.name)
+
+    def tearDown(self) -> None:
+        self.store.close()
+        for suffix in ("", "-wal", "-shm"):
+            try:
+                os.remove(self._tmp.name + suffix)
+            except FileNotFoundError:
+                pass
+
+    def test_stats_route_is_not_shadowed_by_run_lookup(self) -> None:
+        self.store.create_run({"targetSpl": 110.0})
+        failed = self.store.create_run({"targetSpl": 112.0})
+        self.store.mark_failed(failed.id, "boom")
+
+        with mock.patch.object(gateway, "_store", self.store), TestClient(gateway.app) as client:
+            response = client.get("/opt/stats")
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual(payload["total"], 2)
+        self.assertEqual(payload["counts"]["queued"], 1)
+        self.assertEqual(payload["counts"]["failed"], 1)
+
+    def test_started_run_is_reported_as_queued(self) -> None:
+        with (
+            mock.patch.object(gateway, "_store", self.store),
+            mock.patch.object(gateway, "_submit_optimisation") as submit,
+            TestClient(gateway.app) as client,
+        ):
+            response = client.post("/opt/start", json={"targetSpl": 110.0, "maxVolume": 60.0})
+
+        self.assertEqual(response.status_code, 200)
+        run = response.json()
+        self.assertEqual(run["status"], "queued")
+        submit.assert_called_once()
+        stored = self.store.get_run(run["id"])
+        assert stored is not None
+        self.assertEqual(stored.status, "queued")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
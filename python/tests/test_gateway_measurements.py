@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import io
 import unittest
 
-from services.gateway.app.main import _measurement_comparison_payload
+from services.gateway.app.main import _measurement_comparison_payload, _parse_measurement_upload
 from spl_core import (
     BoxDesign,
     DriverParameters,
@@ -192,5 +193,14 @@ class MeasurementComparisonPayloadTests(unittest.TestCase):
                 self.assertLess(rerun_p95 + 1e-6, p95 + 1e-6)
 
 
+class MeasurementUploadTests(unittest.TestCase):
+    def test_dat_upload_falls_back_to_latin1(self) -> None:
+        handle = io.BytesIO("# Messung \xb0C\n20;85.0\n40;88.5\n".encode("latin-1"))
+        trace = _parse_measurement_upload("sweep.dat", handle)
+
+        self.assertEqual(trace.frequency_hz, [20.0, 40.0])
+        self.assertFalse(handle.closed)
+
+
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
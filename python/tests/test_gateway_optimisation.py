@@ -1,16 +1,30 @@
 from __future__ import annotations
 
+import os
+import tempfile
+import threading
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from unittest import mock
 
-from services.gateway.app.main import _build_optimisation_result
+from services.gateway.app.main import (
+    _build_optimisation_result,
+    _positive_int,
+    _submit_optimisation,
+)
+from services.gateway.app.store import RunStore
 
 
 class OptimisationResultTests(unittest.TestCase):
     def test_default_alignment_is_sealed(self) -> None:
         result = _build_optimisation_result({})
         self.assertEqual(result["alignment"], "sealed")
-        self.assertIn("history", result)
-        self.assertGreater(len(result["history"]), 0)
+        history = result["history"]
+        self.assertGreater(len(history["iter"]), 0)
+        self.assertEqual(len(history["loss"]), len(history["iter"]))
+        self.assertEqual(len(history["gradNorm"]), len(history["iter"]))
+        self.assertEqual(result["convergence"]["iterations"], len(history["iter"]))
         solution = result["convergence"]["solution"]
         self.assertIn("fc_hz", solution)
         self.assertIn("alignment", solution)
@@ -28,5 +42,64 @@ class OptimisationResultTests(unittest.TestCase):
         self.assertIn("max_port_velocity_ms", summary)
 
 
+class OptimisationSubmissionTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.NamedTemporaryFile(delete=False)
+        self._tmp.close()
+        self.store = RunStore(self._tmp.name)
+
+    def tearDown(self) -> None:
+        self.store.close()
+        for suffix in ("", "-wal", "-shm"):
+            try:
+                os.remove(self._tmp.name + suffix)
+            except FileNotFoundError:
+                pass
+
+    def test_submitted_run_is_completed_by_executor(self) -> None:
+        record = self.store.create_run({"preferAlignment": "vented"})
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            _submit_optimisation(executor, self.store, record.id, record.params)
+
+        fetched = self.store.get_run(record.id)
+        assert fetched is not None
+        self.assertEqual(fetched.status, "succeeded")
+        assert fetched.result is not None
+        self.assertEqual(fetched.result["alignment"], "vented")
+
+    def test_run_is_queued_until_a_worker_starts_it(self) -> None:
+        started = threading.Event()
+        release = threading.Event()
+
+        def build(params: dict[str, Any]) -> dict[str, Any]:
+            started.set()
+            release.wait(timeout=10)
+            return {"alignment": "sealed"}
+
+        first = self.store.create_run({})
+        second = self.store.create_run({})
+        with (
+            mock.patch("services.gateway.app.main._build_optimisation_result", side_effect=build),
+            ThreadPoolExecutor(max_workers=1) as executor,
+        ):
+            _submit_optimisation(executor, self.store, first.id, first.params)
+            _submit_optimisation(executor, self.store, second.id, second.params)
+            self.assertTrue(started.wait(timeout=10))
+            statuses = {run.id: run.status for run in self.store.list_runs()}
+            release.set()
+
+        self.assertEqual(statuses, {first.id: "running", second.id: "queued"})
+        for run in self.store.list_runs():
+            self.assertEqual(run.status, "succeeded")
+
+
+class PositiveIntSettingTests(unittest.TestCase):
+    def test_unset_invalid_or_non_positive_values_use_the_default(self) -> None:
+        self.assertEqual(_positive_int("3", 8), 3)
+        for value in (None, "", "0", "-4", "four", "2.5"):
+            with self.subTest(value=value):
+                self.assertEqual(_positive_int(value, 8), 8)
+
+
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import unittest
+
+from services.gateway.app.main import (
+    _ResponseCache,
+    _sealed_simulation_payload,
+    _sealed_solver,
+    _vented_simulation_payload,
+)
+from spl_core import BoxDesign, DriverParameters, PortGeometry, VentedBoxDesign
+
+
+class SimulationPayloadTests(unittest.TestCase):
+    driver: DriverParameters
+    frequencies: list[float]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.driver = DriverParameters(
+            fs_hz=30.0,
+            qts=0.37,
+            re_ohm=3.6,
+            bl_t_m=15.8,
+            mms_kg=0.128,
+            sd_m2=0.054,
+            le_h=0.0007,
+            vas_l=80.0,
+            xmax_mm=11.0,
+        )
+        cls.frequencies = list(map(float, range(20, 201, 10)))
+
+    def test_sealed_payload_merges_response_and_summary(self) -> None:
+        payload = _sealed_simulation_payload(
+            self.driver,
+            BoxDesign(volume_l=50.0),
+            self.frequencies,
+            mic_distance_m=1.0,
+            drive_voltage=2.83,
+        )
+
+        self.assertEqual(len(payload["spl_db"]), len(self.frequencies))
+        self.assertIn("summary", payload)
+        self.assertEqual(payload["fc_hz"], payload["summary"]["fc_hz"])
+        self.assertIn("qtc", payload)
+
+    def test_vented_payload_reports_port_metrics(self) -> None:
+        box = VentedBoxDesign(
+            volume_l=65.0,
+            port=PortGeometry(diameter_m=0.08, length_m=0.2),
+        )
+        payload = _vented_simulation_payload(
+            self.driver,
+            box,
+            self.frequencies,
+            mic_distance_m=1.0,
+            drive_voltage=2.83,
+        )
+
+        self.assertEqual(len(payload["port_velocity_ms"]), len(self.frequencies))
+        self.assertEqual(payload["fb_hz"], payload["summary"]["fb_hz"])
+        self.assertGreater(payload["max_port_velocity_ms"], 0.0)
+
+    def test_solver_factory_reuses_instances_for_equal_designs(self) -> None:
+        first = _sealed_solver(self.driver, BoxDesign(volume_l=50.0), 2.83)
+        second = _sealed_solver(self.driver, BoxDesign(volume_l=50.0), 2.83)
+        other = _sealed_solver(self.driver, BoxDesign(volume_l=60.0), 2.83)
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+
+
+class ResponseCacheTests(unittest.TestCase):
+    def test_evicts_least_recently_used_entry(self) -> None:
+        cache = _ResponseCache(maxsize=2)
+        cache.put("a", b"1")
+        cache.put("b", b"2")
+        self.assertEqual(cache.get("a"), b"1")
+
+        cache.put("c", b"3")
+
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), b"1")
+        self.assertEqual(cache.get("c"), b"3")
+
+    def test_zero_size_disables_caching(self) -> None:
+        cache = _ResponseCache(maxsize=0)
+        cache.put("a", b"1")
+
+        self.assertIsNone(cache.get("a"))
+
+    def test_evicts_to_stay_within_byte_budget(self) -> None:
+        cache = _ResponseCache(maxsize=10, maxbytes=4)
+        cache.put("a", b"12")
+        cache.put("b", b"34")
+        cache.put("c", b"56")
+        cache.put("huge", b"123456")
+
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("b"), b"34")
+        self.assertEqual(cache.get("c"), b"56")
+        self.assertIsNone(cache.get("huge"))
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import os
 import tempfile
+import threading
 import unittest
+from unittest import mock
 
 from services.gateway.app.store import RunStore
 
@@ -14,10 +16,12 @@ class RunStoreTests(unittest.TestCase):
         self.store = RunStore(self._tmp.name)
 
     def tearDown(self) -> None:
-        try:
-            os.remove(self._tmp.name)
-        except FileNotFoundError:
-            pass
+        self.store.close()
+        for suffix in ("", "-wal", "-shm"):
+            try:
+                os.remove(self._tmp.name + suffix)
+            except FileNotFoundError:
+                pass
 
     def test_create_and_fetch(self) -> None:
         record = self.store.create_run({"targetSpl": 118.0})
@@ -36,6 +40,7 @@ class RunStoreTests(unittest.TestCase):
         assert fetched is not None
         self.assertEqual(fetched.status, "succeeded")
         self.assertEqual(fetched.result, result)
+        self.assertIs(fetched.result, fetched.result)
 
     def test_mark_failed_sets_error(self) -> None:
         record = self.store.create_run({})
@@ -53,6 +58,30 @@ class RunStoreTests(unittest.TestCase):
         self.assertEqual(runs[0].id, second.id)
         self.assertEqual(runs[1].id, first.id)
 
+    def test_list_runs_pages_with_before_cursor(self) -> None:
+        first = self.store.create_run({"targetSpl": 100.0})
+        second = self.store.create_run({"targetSpl": 105.0})
+        page = self.store.list_runs(limit=1)
+        self.assertEqual([run.id for run in page], [second.id])
+        next_page = self.store.list_runs(limit=1, before=page[-1].created_at)
+        self.assertEqual([run.id for run in next_page], [first.id])
+
+    def test_list_runs_cursor_breaks_timestamp_ties_by_id(self) -> None:
+        with mock.patch("services.gateway.app.store.time.time", return_value=1000.0):
+            created = self.store.create_runs([{"targetSpl": float(spl)} for spl in range(3)])
+
+        seen: list[str] = []
+        cursor: tuple[float, str] | None = None
+        while True:
+            before, before_id = cursor if cursor else (None, None)
+            page = self.store.list_runs(limit=1, before=before, before_id=before_id)
+            if not page:
+                break
+            seen.extend(run.id for run in page)
+            cursor = (page[-1].created_at, page[-1].id)
+
+        self.assertEqual(seen, sorted((run.id for run in created), reverse=True))
+
     def test_list_runs_with_status_filter(self) -> None:
         queued = self.store.create_run({})
         running = self.store.create_run({})
@@ -88,6 +117,65 @@ class RunStoreTests(unittest.TestCase):
         self.assertEqual(counts["failed"], 1)
         self.assertEqual(counts["succeeded"], 0)
 
+    def test_status_counts_cache_is_invalidated_by_writes(self) -> None:
+        store = RunStore(self._tmp.name, counts_ttl_s=3600.0)
+        self.addCleanup(store.close)
+        self.assertEqual(store.status_counts()["queued"], 0)
+
+        store.status_counts()["queued"] = 99
+        self.assertEqual(store.status_counts()["queued"], 0)
+
+        record = store.create_run({})
+        self.assertEqual(store.status_counts()["queued"], 1)
+        store.mark_running(record.id)
+        self.assertEqual(store.status_counts()["running"], 1)
+
+    def test_writes_from_another_thread_use_their_own_connection(self) -> None:
+        record = self.store.create_run({})
+        worker = threading.Thread(target=self.store.complete_run, args=(record.id, {"ok": True}))
+        worker.start()
+        worker.join(timeout=10)
+        self.assertFalse(worker.is_alive())
+
+        fetched = self.store.get_run(record.id)
+        assert fetched is not None
+        self.assertEqual(fetched.status, "succeeded")
+
+    def test_transaction_commits_grouped_writes(self) -> None:
+        with self.store.transaction():
+            record = self.store.create_run({})
+            self.store.mark_running(record.id)
+
+        fetched = self.store.get_run(record.id)
+        assert fetched is not None
+        self.assertEqual(fetched.status, "running")
+
+    def test_transaction_rolls_back_on_error(self) -> None:
+        with self.assertRaises(KeyError):
+            with self.store.transaction():
+                self.store.create_run({})
+                self.store.mark_running("missing")
+
+        self.assertEqual(self.store.list_runs(), [])
+
+    def test_create_runs_inserts_batch(self) -> None:
+        records = self.store.create_runs([{"targetSpl": 110.0}, {"targetSpl": 115.0}])
+
+        self.assertEqual(len(records), 2)
+        self.assertEqual(self.store.status_counts()["queued"], 2)
+        fetched = self.store.get_run(records[1].id)
+        assert fetched is not None
+        self.assertEqual(fetched.params["targetSpl"], 115.0)
+        self.assertEqual(self.store.create_runs([]), [])
+
+    def test_close_reconnects_on_next_use(self) -> None:
+        record = self.store.create_run({"targetSpl": 112.0})
+        self.store.close()
+
+        fetched = self.store.get_run(record.id)
+        assert fetched is not None
+        self.assertEqual(fetched.id, record.id)
+
 
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
@@ -1,3 +1,4 @@
+import cmath
 import io
 import json
 import math
@@ -5,6 +6,7 @@ import pathlib
 import sys
 import unittest
 import zipfile
+from collections.abc import Mapping
 
 sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
 
@@ -22,6 +24,26 @@ from spl_core import (
     parse_rew_mdat,
 )
 
+_REW_PAYLOAD = {
+    "measurement": {
+        "frequency": [25.0, 63.0, 125.0],
+        "spl": [81.2, 87.5, 92.0],
+        "phase": [-60.0, -35.0, -20.0],
+        "impedance_real": [6.1, 5.8, 4.9],
+        "impedance_imag": [3.0, 2.6, 1.4],
+    }
+}
+
+
+def _build_rew_mdat(payload: Mapping[str, object]) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_STORED) as archive:
+        archive.writestr("measurement.json", json.dumps(payload))
+    return buffer.getvalue()
+
+
+REW_MDAT_BYTES = _build_rew_mdat(_REW_PAYLOAD)
+
 
 class MeasurementParsingTests(unittest.TestCase):
     def test_parse_klippel_dat_with_impedance(self) -> None:
@@ -42,26 +64,33 @@ class MeasurementParsingTests(unittest.TestCase):
         assert trace.impedance_ohm is not None
         self.assertTrue(all(isinstance(z, complex) for z in trace.impedance_ohm))
 
+    def test_parse_klippel_dat_keeps_impedance_columns_aligned(self) -> None:
+        payload = "20;85.0\n30;86.0;-40;4.0;1.0\n40;87.0;-35;5.0;bad\n50;88.0;-30;6.0;2.0\n"
+        trace = parse_klippel_dat(payload)
+
+        assert trace.impedance_ohm is not None
+        self.assertEqual(len(trace.impedance_ohm), len(trace.frequency_hz))
+        self.assertTrue(cmath.isnan(trace.impedance_ohm[0]))
+        self.assertEqual(trace.impedance_ohm[1], complex(4.0, 1.0))
+        self.assertTrue(cmath.isnan(trace.impedance_ohm[2]))
+        self.assertEqual(trace.impedance_ohm[3], complex(6.0, 2.0))
+
     def test_parse_rew_mdat_json(self) -> None:
-        payload = {
-            "measurement": {
-                "frequency": [25.0, 63.0, 125.0],
-                "spl": [81.2, 87.5, 92.0],
-                "phase": [-60.0, -35.0, -20.0],
-                "impedance_real": [6.1, 5.8, 4.9],
-                "impedance_imag": [3.0, 2.6, 1.4],
-            }
-        }
-        buffer = io.BytesIO()
-        with zipfile.ZipFile(buffer, mode="w") as archive:
-            archive.writestr("measurement.json", json.dumps(payload))
-        trace = parse_rew_mdat(buffer.getvalue())
+        trace = parse_rew_mdat(REW_MDAT_BYTES)
         self.assertEqual(trace.frequency_hz, [25.0, 63.0, 125.0])
         assert trace.spl_db is not None
         self.assertEqual(len(trace.spl_db), 3)
         assert trace.impedance_ohm is not None
         self.assertAlmostEqual(abs(trace.impedance_ohm[0]), math.hypot(6.1, 3.0))
 
+    def test_parsers_accept_streams(self) -> None:
+        rew = parse_rew_mdat(io.BytesIO(REW_MDAT_BYTES))
+        self.assertEqual(rew.frequency_hz, [25.0, 63.0, 125.0])
+
+        klippel = parse_klippel_dat(io.StringIO("# header\n20;85.0\n40;88.5\n"))
+        self.assertEqual(klippel.frequency_hz, [20.0, 40.0])
+        self.assertEqual(klippel.spl_db, [85.0, 88.5])
+
 
 class MeasurementComparisonTests(unittest.TestCase):
     def setUp(self) -> None:
@@ -124,7 +153,8 @@ class MeasurementComparisonTests(unittest.TestCase):
         measurement = MeasurementTrace(
             frequency_hz=measurement_axis,
             spl_db=[value + 0.8 for value in resampled.spl_db],
-            impedance_ohm=[complex(abs(z) * 1.05, 0.0) for z in resampled.impedance_ohm or []] or None,
+            impedance_ohm=[complex(mag * 1.05, 0.0) for mag in map(abs, resampled.impedance_ohm or [])]
+            or None,
         )
         delta, stats, diagnosis = compare_measurement_to_prediction(measurement, self.prediction)
         assert stats.spl_rmse_db is not None
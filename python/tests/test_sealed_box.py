@@ -9,8 +9,13 @@ from spl_core import BoxDesign, DriverParameters, SealedBoxSolver
 
 
 class SealedBoxSolverTest(unittest.TestCase):
-    def setUp(self) -> None:
-        self.driver = DriverParameters(
+    driver: DriverParameters
+    box: BoxDesign
+    solver: SealedBoxSolver
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.driver = DriverParameters(
             fs_hz=37.2,
             qts=0.38,
             re_ohm=5.6,
@@ -21,8 +26,8 @@ class SealedBoxSolverTest(unittest.TestCase):
             vas_l=92.0,
             xmax_mm=11.5,
         )
-        self.box = BoxDesign(volume_l=50.0)
-        self.solver = SealedBoxSolver(self.driver, self.box)
+        cls.box = BoxDesign(volume_l=50.0)
+        cls.solver = SealedBoxSolver(cls.driver, cls.box)
 
     def test_alignment_estimates(self) -> None:
         fc = self.solver.system_resonance()
@@ -54,7 +59,8 @@ class SealedBoxSolverTest(unittest.TestCase):
         self.assertAlmostEqual(d_mid, v_mid / (2 * math.pi * freqs[1]), places=6)
         self.assertAlmostEqual(d_high, v_high / (2 * math.pi * freqs[2]), places=6)
 
-        z_mag = abs(response.impedance_ohm[1])
+        z_mag = response.impedance_magnitude_ohm()[1]
+        self.assertAlmostEqual(z_mag, abs(response.impedance_ohm[1]))
         self.assertGreater(z_mag, self.driver.re_ohm)
 
         as_dict = response.to_dict()
@@ -63,7 +69,7 @@ class SealedBoxSolverTest(unittest.TestCase):
         self.assertIn("cone_displacement_m", as_dict)
 
     def test_alignment_summary_band_edges(self) -> None:
-        freqs = [float(f) for f in range(10, 201, 2)]
+        freqs = list(map(float, range(10, 201, 2)))
         response = self.solver.frequency_response(freqs)
         summary = self.solver.alignment_summary(response)
 
@@ -88,7 +94,7 @@ class SealedBoxSolverTest(unittest.TestCase):
         self.assertIn("max_cone_displacement_m", summary_dict)
 
     def test_safe_drive_voltage_scaling(self) -> None:
-        freqs = [float(f) for f in range(15, 201, 5)]
+        freqs = list(map(float, range(15, 201, 5)))
         response = self.solver.frequency_response(freqs)
         summary = self.solver.alignment_summary(response)
 
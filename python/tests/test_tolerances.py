@@ -2,19 +2,24 @@ from __future__ import annotations
 
 import random
 import unittest
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 
 from spl_core import (
     BoxDesign,
     DriverParameters,
     PortGeometry,
+    ToleranceReport,
     VentedBoxDesign,
     run_tolerance_analysis,
 )
 
+FREQUENCIES = list(map(float, range(20, 201, 10)))
 
-class ToleranceAnalysisTests(unittest.TestCase):
+
+class SealedToleranceTests(unittest.TestCase):
     def setUp(self) -> None:
-        self.frequencies = [float(f) for f in range(20, 201, 10)]
+        self.frequencies = list(FREQUENCIES)
+        self.rng = random.Random(42)
 
     def test_sealed_tolerance_analysis_reports_excursion_rate(self) -> None:
         driver = DriverParameters(
@@ -35,7 +40,7 @@ class ToleranceAnalysisTests(unittest.TestCase):
             box,
             self.frequencies,
             30,
-            rng=random.Random(42),
+            rng=self.rng,
             drive_voltage=8.0,
             excursion_limit_ratio=0.05,
         )
@@ -51,6 +56,12 @@ class ToleranceAnalysisTests(unittest.TestCase):
         self.assertIn(report.risk_rating, {"low", "moderate", "high"})
         self.assertGreater(len(report.risk_factors), 0)
 
+
+class VentedToleranceTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.frequencies = list(FREQUENCIES)
+        self.rng = random.Random(123)
+
     def test_vented_tolerance_analysis_flags_port_velocity(self) -> None:
         driver = DriverParameters(
             fs_hz=28.0,
@@ -74,7 +85,7 @@ class ToleranceAnalysisTests(unittest.TestCase):
             vented,
             self.frequencies,
             25,
-            rng=random.Random(123),
+            rng=self.rng,
             drive_voltage=7.0,
             port_velocity_limit_ms=9.0,
         )
@@ -89,6 +100,50 @@ class ToleranceAnalysisTests(unittest.TestCase):
         self.assertIn(report.risk_rating, {"low", "moderate", "high"})
         self.assertGreater(len(report.risk_factors), 0)
 
+    def _chunked_analysis(self, executor: Executor) -> ToleranceReport:
+        driver = DriverParameters(
+            fs_hz=28.0,
+            qts=0.34,
+            re_ohm=3.4,
+            bl_t_m=16.5,
+            mms_kg=0.130,
+            sd_m2=0.056,
+            le_h=0.0006,
+            vas_l=85.0,
+            xmax_mm=5.0,
+        )
+        vented = VentedBoxDesign(
+            volume_l=60.0,
+            port=PortGeometry(diameter_m=0.055, length_m=0.18, count=1),
+        )
+        return run_tolerance_analysis(
+            "vented",
+            driver,
+            vented,
+            self.frequencies,
+            25,
+            rng=random.Random(7),
+            port_velocity_limit_ms=9.0,
+            executor=executor,
+            chunks=4,
+        )
+
+    def test_chunked_analysis_is_reproducible_across_workers(self) -> None:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            first = self._chunked_analysis(executor)
+            second = self._chunked_analysis(executor)
+
+        self.assertEqual(first.runs, 25)
+        self.assertIn("max_port_velocity_ms", first.metrics)
+        self.assertEqual(first.to_dict(), second.to_dict())
+
+    def test_chunked_analysis_runs_in_worker_processes(self) -> None:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            threaded = self._chunked_analysis(executor)
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            pooled = self._chunked_analysis(executor)
+
+        self.assertEqual(pooled.to_dict(), threaded.to_dict())
 
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
@@ -8,13 +8,21 @@ from spl_core import (
     DriverParameters,
     PortGeometry,
     VentedBoxDesign,
+    VentedBoxResponse,
     VentedBoxSolver,
 )
 
 
 class VentedBoxSolverTest(unittest.TestCase):
-    def setUp(self) -> None:
-        self.driver = DriverParameters(
+    driver: DriverParameters
+    box: VentedBoxDesign
+    solver: VentedBoxSolver
+    response_5hz: VentedBoxResponse
+    response_2hz: VentedBoxResponse
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.driver = DriverParameters(
             fs_hz=28.5,
             qts=0.36,
             re_ohm=3.4,
@@ -27,12 +35,17 @@ class VentedBoxSolverTest(unittest.TestCase):
         )
 
         port = PortGeometry(diameter_m=0.1, length_m=0.22, count=1, loss_q=16.0)
-        self.box = VentedBoxDesign(volume_l=70.0, port=port, leakage_q=12.0)
-        self.solver = VentedBoxSolver(self.driver, self.box)
+        cls.box = VentedBoxDesign(volume_l=70.0, port=port, leakage_q=12.0)
+        cls.solver = VentedBoxSolver(cls.driver, cls.box)
+
+        # Sweeps shared by several tests are solved once per class.
+        cls.response_5hz = cls.solver.frequency_response(list(map(float, range(20, 151, 5))))
+        cls.response_2hz = cls.solver.frequency_response(list(map(float, range(18, 181, 2))))
 
     def test_tuning_frequency(self) -> None:
         fb = self.solver.tuning_frequency()
         self.assertTrue(28.0 < fb < 42.0)
+        self.assertTrue(28.0**2 < self.solver.tuning_frequency_squared() < 42.0**2)
 
     def test_frequency_response_characteristics(self) -> None:
         fb = self.solver.tuning_frequency()
@@ -61,25 +74,22 @@ class VentedBoxSolverTest(unittest.TestCase):
         self.assertIn("cone_displacement_m", response.to_dict())
 
     def test_impedance_double_peak(self) -> None:
-        freqs = [float(f) for f in range(20, 151, 5)]
-        response = self.solver.frequency_response(freqs)
-        mags = [abs(z) for z in response.impedance_ohm]
+        # Start below the lower peak so both maxima are interior samples.
+        response = self.solver.frequency_response(list(map(float, range(10, 151, 5))))
+        peaks = response.impedance_peaks(self.driver.re_ohm * 1.2)
 
-        threshold = self.driver.re_ohm * 1.2
-        peak_count = 0
-        for i, mag in enumerate(mags):
-            if mag <= threshold:
-                continue
-            left = mags[i - 1] if i > 0 else mags[i + 1]
-            right = mags[i + 1] if i < len(mags) - 1 else mags[i - 1]
-            if mag >= left and mag >= right:
-                peak_count += 1
+        self.assertEqual(len(peaks), 2)
+        self.assertLess(peaks[0], self.driver.fs_hz)
+        self.assertGreater(peaks[1], self.driver.fs_hz)
 
-        self.assertGreaterEqual(peak_count, 2)
+    def test_impedance_peaks_ignore_sweep_edges(self) -> None:
+        peaks = self.response_5hz.impedance_peaks(self.driver.re_ohm * 1.2)
+
+        self.assertNotIn(self.response_5hz.frequency_hz[0], peaks)
+        self.assertEqual(len(peaks), 1)
 
     def test_alignment_summary_port_metrics(self) -> None:
-        freqs = [float(f) for f in range(18, 181, 2)]
-        response = self.solver.frequency_response(freqs)
+        response = self.response_2hz
         summary = self.solver.alignment_summary(response)
 
         self.assertAlmostEqual(summary.fb_hz, self.solver.tuning_frequency(), places=6)
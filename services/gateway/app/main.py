@@ -2,24 +2,59 @@
 
 from __future__ import annotations
 
+import io
 import math
 import os
-from typing import TYPE_CHECKING, Any, Literal, cast
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import CancelledError, Executor, Future, ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from functools import cache, lru_cache, partial
+from hashlib import blake2b
+from operator import attrgetter
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO, Literal, TypeVar, cast
 
 if TYPE_CHECKING:  # pragma: no cover
-    from fastapi import BackgroundTasks, FastAPI, HTTPException, UploadFile
-    from pydantic import BaseModel, Field
+    from fastapi import FastAPI, HTTPException, Request, Response, UploadFile
+    from fastapi.concurrency import run_in_threadpool
+    from fastapi.exceptions import RequestValidationError
+    from fastapi.middleware.gzip import GZipMiddleware
+    from fastapi.openapi.utils import (
+        validation_error_definition,
+        validation_error_response_definition,
+    )
+    from pydantic import BaseModel, Field, ValidationError
 else:  # pragma: no branch
     try:
-        from fastapi import BackgroundTasks, FastAPI, HTTPException, UploadFile
-        from pydantic import BaseModel, Field
+        from fastapi import FastAPI, HTTPException, Request, Response, UploadFile
+        from fastapi.concurrency import run_in_threadpool
+        from fastapi.exceptions import RequestValidationError
+        from fastapi.middleware.gzip import GZipMiddleware
+        from fastapi.openapi.utils import (
+            validation_error_definition,
+            validation_error_response_definition,
+        )
+        from pydantic import BaseModel, Field, ValidationError
     except ImportError:  # pragma: no cover
         FastAPI = cast(Any, None)
+        GZipMiddleware = cast(Any, None)
+        validation_error_definition: dict[str, Any] = {}
+        validation_error_response_definition: dict[str, Any] = {}
         BaseModel = cast(Any, object)
+        Request = cast(Any, object)
+        Response = cast(Any, object)
+
+        class ValidationError(ValueError):  # pragma: no cover
+            def errors(self) -> list[dict[str, Any]]:
+                return []
 
-        class BackgroundTasks:  # pragma: no cover
-            def add_task(self, *_: Any, **__: Any) -> None:
-                raise RuntimeError("FastAPI is not installed")
+        class RequestValidationError(ValueError):  # pragma: no cover
+            def __init__(self, errors: Any) -> None:
+                super().__init__(errors)
+
+        async def run_in_threadpool(func: Any, *args: Any, **kwargs: Any) -> Any:  # pragma: no cover
+            return func(*args, **kwargs)
 
         class HTTPException(Exception):  # pragma: no cover
             def __init__(self, status_code: int, detail: str) -> None:
@@ -38,11 +73,16 @@ from spl_core import (
     BoxDesign,
     DriverParameters,
     HybridBoxSolver,
+    MeasurementDiagnosis,
     MeasurementTrace,
     PortGeometry,
+    SealedAlignmentSummary,
+    SealedBoxResponse,
     SealedBoxSolver,
     ToleranceSpec,
+    VentedAlignmentSummary,
     VentedBoxDesign,
+    VentedBoxResponse,
     VentedBoxSolver,
     apply_calibration_overrides_to_box,
     apply_calibration_overrides_to_drive_voltage,
@@ -62,16 +102,98 @@ from .store import VALID_STATUSES, RunStore
 DEFAULT_FREQUENCY_RANGE = (math.log10(20.0), math.log10(200.0), 60)
 DEFAULT_ALIGNMENT = "sealed"
 
+
+def _positive_int(value: str | None, default: int) -> int:
+    """Parse an integer setting; unset, invalid or non-positive values give ``default``."""
+
+    try:
+        configured = int(value or "0")
+    except ValueError:
+        return default
+    return configured if configured > 0 else default
+
+
+# Size of the process pool that runs optimisations.
+WORKER_PROCESSES = _positive_int(os.environ.get("BAGGER_SPL_WORKER_PROCESSES"), os.cpu_count() or 1)
+# Tolerance sweeps get their own pool so a large sweep never queues ahead of
+# optimisation runs; each sweep is split into one chunk per tolerance worker.
+TOLERANCE_PROCESSES = _positive_int(
+    os.environ.get("BAGGER_SPL_TOLERANCE_PROCESSES"), WORKER_PROCESSES
+)
+_TOLERANCE_CHUNKS = TOLERANCE_PROCESSES
+RESPONSE_CACHE_SIZE = _positive_int(os.environ.get("BAGGER_SPL_RESPONSE_CACHE_SIZE"), 256)
+RESPONSE_CACHE_BYTES = _positive_int(os.environ.get("BAGGER_SPL_RESPONSE_CACHE_BYTES"), 64 * 1024 * 1024)
+_HEALTH_BODY = b'{"status":"ok"}'
+# Frequency-response arrays compress several-fold; tiny bodies are not worth the CPU.
+_GZIP_MINIMUM_SIZE = 2048
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
 app: Any
 _store: RunStore | None = None
 
 
+@cache
 def solver_schema_catalog() -> dict[str, dict[str, dict[str, Any]]]:
-    """Return the JSON schema catalog for the available solver families."""
+    """Return the JSON schema catalog for the available solver families.
+
+    The catalog is static for the lifetime of the process, so it is built once
+    and shared; callers must treat the returned mapping as read-only.
+    """
 
     return solver_json_schemas()
 
 
+@cache
+def _solver_schema_catalog_body() -> bytes:
+    """Return the serialised ``/schemas/solvers`` body, encoded once per process."""
+
+    return bytes(_default_response_class()({"solvers": solver_schema_catalog()}).body)
+
+
+@cache
+def _solver_schema_bodies() -> dict[str, bytes]:
+    """Return the serialised per-alignment schema bodies, keyed by alignment."""
+
+    render = _default_response_class()
+    bodies: dict[str, bytes] = {}
+    for key, entry in solver_schema_catalog().items():
+        payload = {"alignment": key, "request": entry["request"], "response": entry["response"]}
+        bodies[key] = bytes(render(payload).body)
+    return bodies
+
+
+@lru_cache(maxsize=256)
+def _sealed_solver(driver: DriverParameters, box: BoxDesign, drive_voltage: float) -> SealedBoxSolver:
+    """Return a shared sealed solver for an immutable driver/box/voltage combination."""
+
+    return SealedBoxSolver(driver, box, drive_voltage=drive_voltage)
+
+
+@lru_cache(maxsize=256)
+def _vented_solver(
+    driver: DriverParameters,
+    box: VentedBoxDesign,
+    drive_voltage: float,
+) -> VentedBoxSolver:
+    """Return a shared vented solver for an immutable driver/box/voltage combination."""
+
+    return VentedBoxSolver(driver, box, drive_voltage=drive_voltage)
+
+
+@cache
+def _default_response_class() -> Any:
+    """Return ORJSONResponse when orjson is installed, else the stock JSONResponse."""
+
+    from fastapi.responses import JSONResponse, ORJSONResponse
+
+    try:
+        import orjson  # noqa: F401
+    except ImportError:  # pragma: no cover - optional accelerator
+        return JSONResponse
+    return ORJSONResponse
+
+
 def _model_dump(model: BaseModel) -> dict[str, Any]:  # pragma: no cover - helper for pydantic v1/v2
     if hasattr(model, "model_dump"):
         return cast(dict[str, Any], model.model_dump())
@@ -80,6 +202,70 @@ def _model_dump(model: BaseModel) -> dict[str, Any]:  # pragma: no cover - helpe
     return dict(model.__dict__)
 
 
+def _validate_json_body(model: type[ModelT], body: bytes) -> ModelT:
+    """Parse and validate a raw JSON body in one pass (``parse_raw`` on pydantic v1)."""
+
+    try:
+        if hasattr(model, "model_validate_json"):
+            return model.model_validate_json(body)
+        return model.parse_raw(body)
+    except ValidationError as exc:
+        errors = [{**error, "loc": ("body", *error["loc"])} for error in exc.errors()]
+        raise RequestValidationError(errors) from exc
+
+
+_COMPONENT_REF = "#/components/schemas/{model}"
+_RAW_BODY_MODELS: dict[str, type[BaseModel]] = {}
+
+
+def _json_body_openapi(model: type[BaseModel]) -> dict[str, Any]:
+    """Document ``model`` as the JSON request body of a route that reads raw bytes.
+
+    FastAPI never sees these models, so they are recorded here and added to
+    ``components/schemas`` by :func:`_register_raw_body_schemas`.
+    """
+
+    _RAW_BODY_MODELS[model.__name__] = model
+    return {
+        "requestBody": {
+            "content": {
+                "application/json": {
+                    "schema": {"$ref": _COMPONENT_REF.format(model=model.__name__)}
+                }
+            },
+            "required": True,
+        },
+        "responses": {
+            "422": {
+                "description": "Validation Error",
+                "content": {
+                    "application/json": {
+                        "schema": {"$ref": _COMPONENT_REF.format(model="HTTPValidationError")}
+                    }
+                },
+            }
+        },
+    }
+
+
+def _register_raw_body_schemas(openapi: dict[str, Any]) -> None:
+    """Add the raw-body request models and their definitions to ``openapi``."""
+
+    schemas = openapi.setdefault("components", {}).setdefault("schemas", {})
+    schemas.setdefault("ValidationError", validation_error_definition)
+    schemas.setdefault("HTTPValidationError", validation_error_response_definition)
+    for name, model in _RAW_BODY_MODELS.items():
+        if hasattr(model, "model_json_schema"):
+            schema = model.model_json_schema(ref_template=_COMPONENT_REF)
+            definitions = schema.pop("$defs", {})
+        else:  # pragma: no cover - pydantic v1
+            schema = model.schema(ref_template=_COMPONENT_REF)
+            definitions = schema.pop("definitions", {})
+        for key, definition in definitions.items():
+            schemas.setdefault(key, definition)
+        schemas.setdefault(name, schema)
+
+
 def _logspace(start: float, stop: float, count: int) -> list[float]:
     if count <= 1:
         return [10 ** start]
@@ -87,22 +273,39 @@ def _logspace(start: float, stop: float, count: int) -> list[float]:
     return [10 ** (start + i * step) for i in range(count)]
 
 
-def _frequency_axis() -> list[float]:
-    lo, hi, count = DEFAULT_FREQUENCY_RANGE
-    return _logspace(lo, hi, count)
+_DEFAULT_FREQUENCY_AXIS: tuple[float, ...] = tuple(_logspace(*DEFAULT_FREQUENCY_RANGE))
+
+
+def _frequency_axis() -> tuple[float, ...]:
+    """Return the shared default log-spaced sweep; callers only iterate it."""
+
+    return _DEFAULT_FREQUENCY_AXIS
+
+
+# The synthetic convergence curve has a fixed shape: 15 geometric decay factors
+# and the matching gradient-norm scales, computed once and scaled per run.
+_HISTORY_DECAY: tuple[float, ...] = tuple(0.72**i for i in range(1, 16))
+_HISTORY_GRAD_SCALE: tuple[float, ...] = tuple(0.5 / (i + 1) for i in range(1, 16))
 
 
-def _iteration_history(target_spl: float, achieved_spl: float) -> tuple[list[dict[str, float]], float]:
+def _iteration_history(target_spl: float, achieved_spl: float) -> tuple[dict[str, list[float]], float]:
+    """Return the synthetic convergence curve as parallel ``iter``/``loss``/``gradNorm`` lists."""
+
     overshoot = max(target_spl - achieved_spl, 0.0)
     base_loss = overshoot**2 or 0.35
-    loss = base_loss + 0.6
-    history: list[dict[str, float]] = []
-    for i in range(1, 16):
-        loss = max(loss * 0.72, 1e-6)
-        grad = max(loss * 0.5 / (i + 1), 1e-4)
-        history.append({"iter": i, "loss": loss, "gradNorm": grad})
-    final_loss = history[-1]["loss"] if history else base_loss
-    return history, final_loss
+    initial_loss = base_loss + 0.6
+    # Closed form of the geometric decay: each entry depends only on ``i``, not on
+    # the previous iteration (the 1e-6 floor is absorbing, so clamping per term is
+    # equivalent to clamping the running value).
+    losses = [max(initial_loss * decay, 1e-6) for decay in _HISTORY_DECAY]
+    history: dict[str, list[float]] = {
+        "iter": list(range(1, len(losses) + 1)),
+        "loss": losses,
+        "gradNorm": [
+            max(loss * scale, 1e-4) for loss, scale in zip(losses, _HISTORY_GRAD_SCALE, strict=True)
+        ],
+    }
+    return history, losses[-1]
 
 
 def _build_metrics(
@@ -159,6 +362,28 @@ def _measurement_from_payload(payload: MeasurementData) -> MeasurementTrace:
         raise HTTPException(status_code=422, detail=str(exc)) from exc
 
 
+def _parse_klippel_stream(handle: BinaryIO, encoding: str) -> MeasurementTrace:
+    handle.seek(0)
+    text = io.TextIOWrapper(handle, encoding=encoding)
+    try:
+        return parse_klippel_dat(text)
+    finally:
+        # Detach so closing the wrapper does not close the underlying upload.
+        text.detach()
+
+
+def _parse_measurement_upload(filename: str, handle: BinaryIO) -> MeasurementTrace:
+    """Parse an uploaded measurement straight from its (spooled) file handle."""
+
+    if filename.endswith(".mdat"):
+        handle.seek(0)
+        return parse_rew_mdat(handle)
+    try:
+        return _parse_klippel_stream(handle, "utf-8")
+    except UnicodeDecodeError:
+        return _parse_klippel_stream(handle, "latin-1")
+
+
 def _band_limited_measurement(
     trace: MeasurementTrace,
     minimum_hz: float | None,
@@ -173,9 +398,60 @@ def _band_limited_measurement(
 
 
 def _band_from_trace(trace: MeasurementTrace) -> dict[str, float]:
-    minimum = min(trace.frequency_hz)
-    maximum = max(trace.frequency_hz)
-    return {"min_hz": float(minimum), "max_hz": float(maximum)}
+    return {"min_hz": min(trace.frequency_hz), "max_hz": max(trace.frequency_hz)}
+
+
+def _comparison_block(
+    response: SealedBoxResponse | VentedBoxResponse,
+    summary: SealedAlignmentSummary | VentedAlignmentSummary,
+    measurement: MeasurementTrace,
+    smoothing_fraction: float | None,
+    port_length_m: float | None = None,
+) -> tuple[dict[str, Any], MeasurementDiagnosis]:
+    """Compare a solved response with the measurement, returning the payload block and diagnosis."""
+
+    predicted = measurement_from_response(response)
+    delta, stats, diagnosis = compare_measurement_to_prediction(
+        measurement,
+        predicted,
+        smoothing_fraction=smoothing_fraction,
+        port_length_m=port_length_m,
+    )
+    block = {
+        "summary": summary.to_dict(),
+        "prediction": predicted.to_dict(),
+        "delta": delta.to_dict(),
+        "stats": stats.to_dict(),
+        "diagnosis": diagnosis.to_dict(),
+    }
+    return block, diagnosis
+
+
+def _sealed_measurement_pass(
+    solver: SealedBoxSolver,
+    measurement: MeasurementTrace,
+    mic_distance_m: float,
+    smoothing_fraction: float | None,
+) -> tuple[dict[str, Any], MeasurementDiagnosis]:
+    """Solve a sealed design on the measurement axis and compare it."""
+
+    response = solver.frequency_response(measurement.frequency_hz, mic_distance_m)
+    summary = solver.alignment_summary(response)
+    return _comparison_block(response, summary, measurement, smoothing_fraction)
+
+
+def _vented_measurement_pass(
+    solver: VentedBoxSolver,
+    measurement: MeasurementTrace,
+    mic_distance_m: float,
+    smoothing_fraction: float | None,
+    port_length_m: float,
+) -> tuple[dict[str, Any], MeasurementDiagnosis]:
+    """Solve a vented design on the measurement axis and compare it."""
+
+    response = solver.frequency_response(measurement.frequency_hz, mic_distance_m)
+    summary = solver.alignment_summary(response)
+    return _comparison_block(response, summary, measurement, smoothing_fraction, port_length_m)
 
 
 def _sealed_measurement_payload(
@@ -187,14 +463,9 @@ def _sealed_measurement_payload(
     apply_overrides: bool,
     smoothing_fraction: float | None,
 ) -> dict[str, Any]:
-    solver = SealedBoxSolver(driver, box, drive_voltage=drive_voltage)
-    response = solver.frequency_response(measurement.frequency_hz, mic_distance_m)
-    summary = solver.alignment_summary(response)
-    predicted = measurement_from_response(response)
-    delta, stats, diagnosis = compare_measurement_to_prediction(
-        measurement,
-        predicted,
-        smoothing_fraction=smoothing_fraction,
+    solver = _sealed_solver(driver, box, drive_voltage)
+    base, diagnosis = _sealed_measurement_pass(
+        solver, measurement, mic_distance_m, smoothing_fraction
     )
     calibration = derive_calibration_update(diagnosis)
     overrides = derive_calibration_overrides(
@@ -204,11 +475,7 @@ def _sealed_measurement_payload(
     )
 
     payload: dict[str, Any] = {
-        "summary": summary.to_dict(),
-        "prediction": predicted.to_dict(),
-        "delta": delta.to_dict(),
-        "stats": stats.to_dict(),
-        "diagnosis": diagnosis.to_dict(),
+        **base,
         "calibration": calibration.to_dict(),
         "calibration_overrides": overrides.to_dict(),
         "frequency_band": _band_from_trace(measurement),
@@ -218,17 +485,11 @@ def _sealed_measurement_payload(
     if apply_overrides:
         calibrated_box = apply_calibration_overrides_to_box(box, overrides)
         calibrated_drive = apply_calibration_overrides_to_drive_voltage(drive_voltage, overrides)
-        sealed_solver = SealedBoxSolver(driver, calibrated_box, drive_voltage=calibrated_drive)
-        calibrated_response = sealed_solver.frequency_response(
-            measurement.frequency_hz,
-            mic_distance_m,
-        )
-        calibrated_summary = sealed_solver.alignment_summary(calibrated_response)
-        calibrated_prediction = measurement_from_response(calibrated_response)
-        calibrated_delta, calibrated_stats, calibrated_diagnosis = compare_measurement_to_prediction(
+        calibrated, _ = _sealed_measurement_pass(
+            _sealed_solver(driver, calibrated_box, calibrated_drive),
             measurement,
-            calibrated_prediction,
-            smoothing_fraction=smoothing_fraction,
+            mic_distance_m,
+            smoothing_fraction,
         )
         payload["calibrated"] = {
             "inputs": {
@@ -238,11 +499,7 @@ def _sealed_measurement_payload(
                 else None,
                 "port_length_m": None,
             },
-            "summary": calibrated_summary.to_dict(),
-            "prediction": calibrated_prediction.to_dict(),
-            "delta": calibrated_delta.to_dict(),
-            "stats": calibrated_stats.to_dict(),
-            "diagnosis": calibrated_diagnosis.to_dict(),
+            **calibrated,
         }
 
     return payload
@@ -257,14 +514,12 @@ def _vented_measurement_payload(
     apply_overrides: bool,
     smoothing_fraction: float | None,
 ) -> dict[str, Any]:
-    solver = VentedBoxSolver(driver, box, drive_voltage=drive_voltage)
-    response = solver.frequency_response(measurement.frequency_hz, mic_distance_m)
-    summary = solver.alignment_summary(response)
-    predicted = measurement_from_response(response)
-    delta, stats, diagnosis = compare_measurement_to_prediction(
+    solver = _vented_solver(driver, box, drive_voltage)
+    base, diagnosis = _vented_measurement_pass(
+        solver,
         measurement,
-        predicted,
-        smoothing_fraction=smoothing_fraction,
+        mic_distance_m,
+        smoothing_fraction,
         port_length_m=box.port.length_m,
     )
     calibration = derive_calibration_update(diagnosis)
@@ -276,11 +531,7 @@ def _vented_measurement_payload(
     )
 
     payload: dict[str, Any] = {
-        "summary": summary.to_dict(),
-        "prediction": predicted.to_dict(),
-        "delta": delta.to_dict(),
-        "stats": stats.to_dict(),
-        "diagnosis": diagnosis.to_dict(),
+        **base,
         "calibration": calibration.to_dict(),
         "calibration_overrides": overrides.to_dict(),
         "frequency_band": _band_from_trace(measurement),
@@ -290,17 +541,11 @@ def _vented_measurement_payload(
     if apply_overrides:
         calibrated_box = apply_calibration_overrides_to_box(box, overrides)
         calibrated_drive = apply_calibration_overrides_to_drive_voltage(drive_voltage, overrides)
-        vented_solver = VentedBoxSolver(driver, calibrated_box, drive_voltage=calibrated_drive)
-        calibrated_response = vented_solver.frequency_response(
-            measurement.frequency_hz,
-            mic_distance_m,
-        )
-        calibrated_summary = vented_solver.alignment_summary(calibrated_response)
-        calibrated_prediction = measurement_from_response(calibrated_response)
-        calibrated_delta, calibrated_stats, calibrated_diagnosis = compare_measurement_to_prediction(
+        calibrated, _ = _vented_measurement_pass(
+            _vented_solver(driver, calibrated_box, calibrated_drive),
             measurement,
-            calibrated_prediction,
-            smoothing_fraction=smoothing_fraction,
+            mic_distance_m,
+            smoothing_fraction,
             port_length_m=calibrated_box.port.length_m,
         )
         payload["calibrated"] = {
@@ -309,16 +554,20 @@ def _vented_measurement_payload(
                 "leakage_q": float(calibrated_box.leakage_q),
                 "port_length_m": float(calibrated_box.port.length_m),
             },
-            "summary": calibrated_summary.to_dict(),
-            "prediction": calibrated_prediction.to_dict(),
-            "delta": calibrated_delta.to_dict(),
-            "stats": calibrated_stats.to_dict(),
-            "diagnosis": calibrated_diagnosis.to_dict(),
+            **calibrated,
         }
 
     return payload
 
 
+# Each alignment's comparison builder assumes its own box type; the request
+# models (BoxPayload / VentedBoxPayload) already guarantee it at the API boundary.
+_COMPARE_IMPLS: dict[str, Callable[..., dict[str, Any]]] = {
+    "sealed": _sealed_measurement_payload,
+    "vented": _vented_measurement_payload,
+}
+
+
 def _measurement_comparison_payload(
     *,
     alignment: Literal["sealed", "vented"],
@@ -330,22 +579,7 @@ def _measurement_comparison_payload(
     apply_overrides: bool,
     smoothing_fraction: float | None,
 ) -> dict[str, Any]:
-    if alignment == "vented":
-        if not isinstance(box, VentedBoxDesign):  # pragma: no cover - defensive
-            raise ValueError("Vented comparisons require a vented box design")
-        return _vented_measurement_payload(
-            driver,
-            box,
-            measurement,
-            mic_distance_m,
-            drive_voltage,
-            apply_overrides,
-            smoothing_fraction,
-        )
-
-    if not isinstance(box, BoxDesign):  # pragma: no cover - defensive
-        raise ValueError("Sealed comparisons require a sealed box design")
-    return _sealed_measurement_payload(
+    return _COMPARE_IMPLS[alignment](
         driver,
         box,
         measurement,
@@ -356,91 +590,180 @@ def _measurement_comparison_payload(
     )
 
 
-def _resolve_alignment(params: dict[str, Any]) -> str:
-    preferred = str(params.get("preferAlignment") or DEFAULT_ALIGNMENT).strip().lower()
-    if preferred in {"sealed", "vented"}:
-        return preferred
-    return DEFAULT_ALIGNMENT
+def _sealed_simulation_payload(
+    driver: DriverParameters,
+    box: BoxDesign,
+    frequencies_hz: list[float],
+    *,
+    mic_distance_m: float,
+    drive_voltage: float,
+) -> dict[str, Any]:
+    solver = _sealed_solver(driver, box, drive_voltage)
+    response = solver.frequency_response(frequencies_hz, mic_distance_m)
+    summary = solver.alignment_summary(response)
+    # to_dict() builds a fresh dict, so the summary fields can be added in place.
+    payload_dict: dict[str, Any] = response.to_dict()
+    payload_dict["summary"] = summary.to_dict()
+    payload_dict["fc_hz"] = summary.fc_hz
+    payload_dict["qtc"] = summary.qtc
+    payload_dict["excursion_ratio"] = summary.excursion_ratio
+    payload_dict["excursion_headroom_db"] = summary.excursion_headroom_db
+    payload_dict["safe_drive_voltage_v"] = summary.safe_drive_voltage_v
+    return payload_dict
+
+
+def _vented_simulation_payload(
+    driver: DriverParameters,
+    box: VentedBoxDesign,
+    frequencies_hz: list[float],
+    *,
+    mic_distance_m: float,
+    drive_voltage: float,
+) -> dict[str, Any]:
+    solver = _vented_solver(driver, box, drive_voltage)
+    response = solver.frequency_response(frequencies_hz, mic_distance_m)
+    summary = solver.alignment_summary(response)
+    # to_dict() builds a fresh dict, so the summary fields can be added in place.
+    payload_dict: dict[str, Any] = response.to_dict()
+    payload_dict["summary"] = summary.to_dict()
+    payload_dict["fb_hz"] = summary.fb_hz
+    payload_dict["max_port_velocity_ms"] = summary.max_port_velocity_ms
+    payload_dict["excursion_ratio"] = summary.excursion_ratio
+    payload_dict["excursion_headroom_db"] = summary.excursion_headroom_db
+    payload_dict["safe_drive_voltage_v"] = summary.safe_drive_voltage_v
+    return payload_dict
+
+
+def _hybrid_simulation_payload(payload: HybridRequest) -> dict[str, Any]:
+    alignment, solver = _hybrid_solver_from_request(payload)
+    result, summary = solver.frequency_response(
+        payload.frequencies_hz,
+        mic_distance_m=payload.mic_distance_m,
+        snapshot_stride=payload.snapshot_stride,
+    )
+    include_snapshots = payload.include_snapshots
 
+    response_payload = result.to_dict(include_snapshots=include_snapshots)
+    if not include_snapshots:
+        response_payload["field_snapshots"] = [
+            snapshot.to_dict(include_pressure=False) for snapshot in result.field_snapshots
+        ]
 
-def _build_optimisation_result(params: dict[str, Any]) -> dict[str, Any]:
-    target_spl = float(params.get("targetSpl", 115.0))
-    volume = max(float(params.get("maxVolume", 55.0)), 5.0)
-    drive_voltage = 2.83
-
-    alignment = _resolve_alignment(params)
-
-    solution_payload: dict[str, Any]
-    metrics_extra: dict[str, float]
-    summary_dict: dict[str, Any]
-    response_dict: dict[str, Any]
-    achieved_spl: float
-    safe_drive: float | None
-
-    if alignment == "vented":
-        vented_solver = VentedBoxSolver(
-            DEFAULT_DRIVER,
-            recommended_vented_alignment(volume),
-            drive_voltage=drive_voltage,
-        )
-        vented_response = vented_solver.frequency_response(_frequency_axis(), 1.0)
-        vented_summary = vented_solver.alignment_summary(vented_response)
-        summary_dict = vented_summary.to_dict()
-        response_dict = vented_response.to_dict()
-        achieved_spl = vented_summary.max_spl_db
-        safe_drive = vented_summary.safe_drive_voltage_v
-        solution_payload = {
-            "spl_peak": vented_summary.max_spl_db,
-            "fb_hz": vented_summary.fb_hz,
-            "excursion_headroom_db": vented_summary.excursion_headroom_db,
-            "max_port_velocity_ms": vented_summary.max_port_velocity_ms,
-            "safe_drive_voltage_v": safe_drive,
-        }
-        metrics_extra = {
-            "max_port_velocity_ms": vented_summary.max_port_velocity_ms,
-        }
-    else:
-        sealed_solver = SealedBoxSolver(
-            DEFAULT_DRIVER,
-            BoxDesign(volume_l=volume, leakage_q=15.0),
-            drive_voltage=drive_voltage,
-        )
-        sealed_response = sealed_solver.frequency_response(_frequency_axis(), 1.0)
-        sealed_summary = sealed_solver.alignment_summary(sealed_response)
-        summary_dict = sealed_summary.to_dict()
-        response_dict = sealed_response.to_dict()
-        achieved_spl = sealed_summary.max_spl_db
-        safe_drive = sealed_summary.safe_drive_voltage_v
-        solution_payload = {
-            "spl_peak": sealed_summary.max_spl_db,
-            "fc_hz": sealed_summary.fc_hz,
-            "qtc": sealed_summary.qtc,
-            "excursion_headroom_db": sealed_summary.excursion_headroom_db,
-            "safe_drive_voltage_v": safe_drive,
-        }
-        metrics_extra = {
-            "fc_hz": sealed_summary.fc_hz,
+    summary_dict = summary.to_dict()
+    response_payload.update(
+        {
+            "summary": summary_dict,
+            "alignment": alignment,
+            "grid_resolution": solver.grid_resolution,
+            "snapshot_stride": result.snapshot_stride,
+            "snapshot_count": len(result.field_snapshots),
+            "suspension_creep": payload.suspension_creep,
+            "plane_metrics": {
+                label: {
+                    "max_pressure_pa": summary.plane_max_pressure_pa[label],
+                    "mean_pressure_pa": summary.plane_mean_pressure_pa[label],
+                    "max_pressure_coords_m": list(
+                        summary.plane_max_pressure_location_m.get(label, (0.0, 0.0, 0.0))
+                    ),
+                }
+                for label in summary.plane_max_pressure_pa
+            },
         }
+    )
+    return response_payload
+
+
+_ALIGNMENTS = frozenset(("sealed", "vented"))
 
-    history, final_loss = _iteration_history(target_spl, achieved_spl)
 
-    convergence = {
-        "converged": final_loss < 1.0,
-        "iterations": len(history),
-        "finalLoss": final_loss,
-        "solution": {"alignment": alignment, **solution_payload},
+def _resolve_alignment(params: dict[str, Any]) -> str:
+    raw = params.get("preferAlignment")
+    if not raw:
+        return DEFAULT_ALIGNMENT
+    if isinstance(raw, str) and raw in _ALIGNMENTS:
+        return raw
+    preferred = str(raw).strip().lower()
+    return preferred if preferred in _ALIGNMENTS else DEFAULT_ALIGNMENT
+
+
+def _sealed_optimisation_result(target_spl: float, volume: float, drive_voltage: float) -> dict[str, Any]:
+    solver = _sealed_solver(DEFAULT_DRIVER, BoxDesign(volume_l=volume, leakage_q=15.0), drive_voltage)
+    response = solver.frequency_response(_frequency_axis(), 1.0)
+    summary = solver.alignment_summary(response)
+    history, final_loss = _iteration_history(target_spl, summary.max_spl_db)
+    return {
+        "alignment": "sealed",
+        "history": history,
+        "convergence": {
+            "converged": final_loss < 1.0,
+            "iterations": len(history["iter"]),
+            "finalLoss": final_loss,
+            "solution": {
+                "alignment": "sealed",
+                "spl_peak": summary.max_spl_db,
+                "fc_hz": summary.fc_hz,
+                "qtc": summary.qtc,
+                "excursion_headroom_db": summary.excursion_headroom_db,
+                "safe_drive_voltage_v": summary.safe_drive_voltage_v,
+            },
+        },
+        "summary": summary.to_dict(),
+        "response": response.to_dict(),
+        "metrics": _build_metrics(
+            target_spl,
+            summary.max_spl_db,
+            volume,
+            summary.safe_drive_voltage_v,
+            {"fc_hz": summary.fc_hz},
+        ),
     }
 
+
+def _vented_optimisation_result(target_spl: float, volume: float, drive_voltage: float) -> dict[str, Any]:
+    solver = _vented_solver(DEFAULT_DRIVER, recommended_vented_alignment(volume), drive_voltage)
+    response = solver.frequency_response(_frequency_axis(), 1.0)
+    summary = solver.alignment_summary(response)
+    history, final_loss = _iteration_history(target_spl, summary.max_spl_db)
     return {
-        "alignment": alignment,
+        "alignment": "vented",
         "history": history,
-        "convergence": convergence,
-        "summary": summary_dict,
-        "response": response_dict,
-        "metrics": _build_metrics(target_spl, achieved_spl, volume, safe_drive, metrics_extra),
+        "convergence": {
+            "converged": final_loss < 1.0,
+            "iterations": len(history["iter"]),
+            "finalLoss": final_loss,
+            "solution": {
+                "alignment": "vented",
+                "spl_peak": summary.max_spl_db,
+                "fb_hz": summary.fb_hz,
+                "excursion_headroom_db": summary.excursion_headroom_db,
+                "max_port_velocity_ms": summary.max_port_velocity_ms,
+                "safe_drive_voltage_v": summary.safe_drive_voltage_v,
+            },
+        },
+        "summary": summary.to_dict(),
+        "response": response.to_dict(),
+        "metrics": _build_metrics(
+            target_spl,
+            summary.max_spl_db,
+            volume,
+            summary.safe_drive_voltage_v,
+            {"max_port_velocity_ms": summary.max_port_velocity_ms},
+        ),
     }
 
 
+_OPTIMISATION_BUILDERS: dict[str, Callable[[float, float, float], dict[str, Any]]] = {
+    "sealed": _sealed_optimisation_result,
+    "vented": _vented_optimisation_result,
+}
+
+
+def _build_optimisation_result(params: dict[str, Any]) -> dict[str, Any]:
+    target_spl = float(params.get("targetSpl", 115.0))
+    volume = max(float(params.get("maxVolume", 55.0)), 5.0)
+    return _OPTIMISATION_BUILDERS[_resolve_alignment(params)](target_spl, volume, 2.83)
+
+
 class DriverPayload(BaseModel):
     fs_hz: float = Field(..., gt=0)
     qts: float = Field(..., gt=0)
@@ -452,8 +775,16 @@ class DriverPayload(BaseModel):
     le_h: float = Field(0.0007, ge=0)
 
     def to_driver(self) -> DriverParameters:
-        data = _model_dump(self)
-        return DriverParameters(**data)
+        return DriverParameters(
+            fs_hz=self.fs_hz,
+            qts=self.qts,
+            vas_l=self.vas_l,
+            re_ohm=self.re_ohm,
+            bl_t_m=self.bl_t_m,
+            mms_kg=self.mms_kg,
+            sd_m2=self.sd_m2,
+            le_h=self.le_h,
+        )
 
 
 class BoxPayload(BaseModel):
@@ -461,8 +792,7 @@ class BoxPayload(BaseModel):
     leakage_q: float = Field(15.0, gt=0)
 
     def to_box(self) -> BoxDesign:
-        data = _model_dump(self)
-        return BoxDesign(**data)
+        return BoxDesign(volume_l=self.volume_l, leakage_q=self.leakage_q)
 
 
 class SealedRequest(BaseModel):
@@ -481,8 +811,13 @@ class PortPayload(BaseModel):
     loss_q: float = Field(18.0, gt=0)
 
     def to_port(self) -> PortGeometry:
-        data = _model_dump(self)
-        return PortGeometry(**data)
+        return PortGeometry(
+            diameter_m=self.diameter_m,
+            length_m=self.length_m,
+            count=self.count,
+            flare_factor=self.flare_factor,
+            loss_q=self.loss_q,
+        )
 
 
 class VentedBoxPayload(BaseModel):
@@ -540,14 +875,16 @@ class MeasurementData(BaseModel):
     thd_percent: list[float] | None = Field(None)
 
     def to_trace(self) -> MeasurementTrace:
-        freq = list(self.frequency_hz)
-        spl = list(self.spl_db)
+        # Validated list fields are already fresh float lists owned by this model,
+        # so the trace can adopt them without copying.
+        freq = self.frequency_hz
+        spl = self.spl_db
         if len(spl) != len(freq):
             raise ValueError("spl_db length must match frequency axis")
-        phase = list(self.phase_deg) if self.phase_deg is not None else None
+        phase = self.phase_deg
         if phase is not None and len(phase) != len(freq):
             raise ValueError("phase_deg length must match frequency axis")
-        thd = list(self.thd_percent) if self.thd_percent is not None else None
+        thd = self.thd_percent
         if thd is not None and len(thd) != len(freq):
             raise ValueError("thd_percent length must match frequency axis")
         impedance: list[complex] | None = None
@@ -556,10 +893,8 @@ class MeasurementData(BaseModel):
         if self.impedance_real is not None and self.impedance_imag is not None:
             if len(self.impedance_real) != len(freq) or len(self.impedance_imag) != len(freq):
                 raise ValueError("Impedance arrays must match frequency axis")
-            impedance = [
-                complex(float(r), float(i))
-                for r, i in zip(self.impedance_real, self.impedance_imag, strict=True)
-            ]
+            # Lengths are checked above, so map() can pair the components in C.
+            impedance = list(map(complex, self.impedance_real, self.impedance_imag))
         return MeasurementTrace(
             frequency_hz=freq,
             spl_db=spl,
@@ -639,194 +974,296 @@ class VentedToleranceRequest(BaseModel):
     port_velocity_limit_ms: float = Field(20.0, gt=0)
 
 
+class _ResponseCache:
+    """Bounded LRU of serialised JSON bodies keyed on a digest of the request.
+
+    Entries are capped both by count and by total body size, since a single
+    hybrid response with field snapshots can run to megabytes; bodies larger
+    than the byte budget are never stored. Only touched from the event loop,
+    so no locking is required.
+    """
+
+    def __init__(self, maxsize: int, maxbytes: int = RESPONSE_CACHE_BYTES) -> None:
+        self._maxsize = maxsize
+        self._maxbytes = maxbytes
+        self._size = 0
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+
+    def get(self, key: str) -> bytes | None:
+        body = self._entries.get(key)
+        if body is not None:
+            self._entries.move_to_end(key)
+        return body
+
+    def put(self, key: str, body: bytes) -> None:
+        if self._maxsize <= 0 or len(body) > self._maxbytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._size -= len(previous)
+        self._entries[key] = body
+        self._size += len(body)
+        while len(self._entries) > self._maxsize or self._size > self._maxbytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+
+async def _cached_json_response(
+    request: Request,
+    cache: _ResponseCache,
+    build: Callable[[bytes], dict[str, Any]],
+) -> Response:
+    """Serve ``build(body)`` for a pure endpoint, reusing bytes for repeated bodies.
+
+    The cache key covers the route path and the raw body and doubles as the
+    ``ETag``. These routes are POST-only, so ``If-None-Match`` is not honoured
+    (RFC 9110 reserves ``304`` for GET/HEAD); hits always resend the bytes.
+    """
+
+    body = await request.body()
+    digest = blake2b(request.url.path.encode(), digest_size=16)
+    digest.update(body)
+    etag = f'"{digest.hexdigest()}"'
+
+    cached = cache.get(etag)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json", headers={"ETag": etag})
+
+    payload = await run_in_threadpool(build, body)
+    response = cast(Response, _default_response_class()(payload, headers={"ETag": etag}))
+    cache.put(etag, bytes(response.body))
+    return response
+
+
+def _simulate_sealed_body(body: bytes) -> dict[str, Any]:
+    payload = _validate_json_body(SealedRequest, body)
+    return _sealed_simulation_payload(
+        payload.driver.to_driver(),
+        payload.box.to_box(),
+        payload.frequencies_hz,
+        mic_distance_m=payload.mic_distance_m,
+        drive_voltage=payload.drive_voltage,
+    )
+
+
+def _simulate_vented_body(body: bytes) -> dict[str, Any]:
+    payload = _validate_json_body(VentedRequest, body)
+    return _vented_simulation_payload(
+        payload.driver.to_driver(),
+        payload.box.to_box(),
+        payload.frequencies_hz,
+        mic_distance_m=payload.mic_distance_m,
+        drive_voltage=payload.drive_voltage,
+    )
+
+
+def _simulate_hybrid_body(body: bytes) -> dict[str, Any]:
+    return _hybrid_simulation_payload(_validate_json_body(HybridRequest, body))
+
+
+def _compare_measurement_body(
+    model: type[SealedMeasurementRequest] | type[VentedMeasurementRequest],
+    alignment: Literal["sealed", "vented"],
+    body: bytes,
+) -> dict[str, Any]:
+    payload = _validate_json_body(model, body)
+    measurement = _measurement_from_payload(payload.measurement)
+    measurement = _band_limited_measurement(
+        measurement, payload.min_frequency_hz, payload.max_frequency_hz
+    )
+    return _measurement_comparison_payload(
+        alignment=alignment,
+        driver=payload.driver.to_driver(),
+        box=payload.box.to_box(),
+        measurement=measurement,
+        mic_distance_m=payload.mic_distance_m,
+        drive_voltage=payload.drive_voltage,
+        apply_overrides=payload.apply_overrides,
+        smoothing_fraction=payload.smoothing_fraction,
+    )
+
+
+# (request field, ToleranceSpec attribute) pairs, in ToleranceOverrides order.
+_TOLERANCE_FIELDS: tuple[tuple[str, str], ...] = (
+    ("driverFs", "driver_fs_pct"),
+    ("driverQts", "driver_qts_pct"),
+    ("driverVas", "driver_vas_pct"),
+    ("driverRe", "driver_re_pct"),
+    ("driverBl", "driver_bl_pct"),
+    ("driverMms", "driver_mms_pct"),
+    ("driverSd", "driver_sd_pct"),
+    ("driverLe", "driver_le_pct"),
+    ("boxVolume", "box_volume_pct"),
+    ("portDiameter", "port_diameter_pct"),
+    ("portLength", "port_length_pct"),
+)
+_NO_TOLERANCE_OVERRIDES: tuple[None, ...] = (None,) * len(_TOLERANCE_FIELDS)
+# One C-level call that reads every override field into a tuple.
+_tolerance_override_values = attrgetter(*(field for field, _ in _TOLERANCE_FIELDS))
+
+
+@lru_cache(maxsize=64)
+def _tolerance_spec_for(values: tuple[float | None, ...]) -> ToleranceSpec:
+    """Return the spec for one override combination; shared, so treat as read-only."""
+
+    updates = {
+        spec_key: float(value)
+        for (_, spec_key), value in zip(_TOLERANCE_FIELDS, values, strict=True)
+        if value is not None
+    }
+    return DEFAULT_TOLERANCES.replace(**updates)
+
+
 def _tolerance_spec_from_payload(overrides: ToleranceOverrides | None) -> ToleranceSpec:
     if overrides is None:
         return DEFAULT_TOLERANCES
-    mapping = {
-        "driverFs": "driver_fs_pct",
-        "driverQts": "driver_qts_pct",
-        "driverVas": "driver_vas_pct",
-        "driverRe": "driver_re_pct",
-        "driverBl": "driver_bl_pct",
-        "driverMms": "driver_mms_pct",
-        "driverSd": "driver_sd_pct",
-        "driverLe": "driver_le_pct",
-        "boxVolume": "box_volume_pct",
-        "portDiameter": "port_diameter_pct",
-        "portLength": "port_length_pct",
-    }
-    updates: dict[str, float] = {}
-    for field, spec_key in mapping.items():
-        value = getattr(overrides, field)
-        if value is not None:
-            updates[spec_key] = float(value)
-    if not updates:
+    fields_set = (
+        overrides.model_fields_set
+        if hasattr(overrides, "model_fields_set")
+        else overrides.__fields_set__
+    )
+    if not fields_set:
         return DEFAULT_TOLERANCES
-    return DEFAULT_TOLERANCES.replace(**updates)
+    values = _tolerance_override_values(overrides)
+    if values == _NO_TOLERANCE_OVERRIDES:
+        return DEFAULT_TOLERANCES
+    return _tolerance_spec_for(values)
 
 
-def _run_optimisation_task(run_id: str, params: dict[str, Any]) -> None:
-    if _store is None:  # pragma: no cover - FastAPI not installed
-        return
+def _finish_optimisation(store: RunStore, run_id: str, future: Future[dict[str, Any]]) -> None:
+    """Persist the outcome of a pooled optimisation run once its future settles."""
+
     try:
-        _store.mark_running(run_id)
-        result = _build_optimisation_result(params)
-        _store.complete_run(run_id, result)
+        result = future.result()
+    except CancelledError:
+        store.mark_failed(run_id, "Optimisation cancelled before completion")
     except Exception as exc:  # pragma: no cover - best effort logging
-        _store.mark_failed(run_id, str(exc))
+        store.mark_failed(run_id, str(exc))
+    else:
+        store.complete_run(run_id, result)
+
+
+def _run_optimisation_job(db_path: Path, run_id: str, params: dict[str, Any]) -> dict[str, Any]:
+    """Worker entry point: flag ``run_id`` as running, then solve it."""
+
+    # The job may run in another process, so it writes through its own store.
+    store = RunStore(db_path)
+    try:
+        store.mark_running(run_id)
+    finally:
+        store.close()
+    return _build_optimisation_result(params)
+
+
+def _submit_optimisation(
+    executor: Executor,
+    store: RunStore,
+    run_id: str,
+    params: dict[str, Any],
+) -> None:
+    """Hand the solver work for a queued ``run_id`` to ``executor``."""
+
+    try:
+        future = executor.submit(_run_optimisation_job, store.path, run_id, params)
+    except Exception as exc:  # pragma: no cover - broken or shut-down pool
+        store.mark_failed(run_id, str(exc))
+        return
+    future.add_done_callback(partial(_finish_optimisation, store, run_id))
 
 
 if FastAPI is not None:  # pragma: no branch
     db_path = os.environ.get("BAGGER_SPL_DB_PATH")
     _store = RunStore(db_path)
-    app = FastAPI(title="Bagger-SPL Gateway", version="0.2.0")
+
+    @asynccontextmanager
+    async def _lifespan(app: Any) -> AsyncIterator[None]:
+        store = _store
+        assert store is not None  # mypy hint
+        # Optimisation runs are CPU-bound, so they execute in worker processes
+        # rather than on the event loop or in the GIL-bound threadpool.
+        app.state.opt_pool = ProcessPoolExecutor(max_workers=WORKER_PROCESSES)
+        app.state.tolerance_pool = ProcessPoolExecutor(max_workers=TOLERANCE_PROCESSES)
+        # Solver and comparison endpoints are pure functions of their body.
+        app.state.response_cache = _ResponseCache(RESPONSE_CACHE_SIZE, RESPONSE_CACHE_BYTES)
+        # Pay the one-off schema builds at startup instead of on the first request.
+        _solver_schema_catalog_body()
+        _solver_schema_bodies()
+        app.openapi()
+        try:
+            yield
+        finally:
+            app.state.opt_pool.shutdown(wait=False, cancel_futures=True)
+            app.state.tolerance_pool.shutdown(wait=False, cancel_futures=True)
+            store.close()
+
+    app = FastAPI(
+        title="Bagger-SPL Gateway",
+        version="0.2.0",
+        default_response_class=_default_response_class(),
+        lifespan=_lifespan,
+    )
+    app.add_middleware(GZipMiddleware, minimum_size=_GZIP_MINIMUM_SIZE)
+    _fastapi_openapi = app.openapi
+
+    def _openapi() -> dict[str, Any]:
+        if app.openapi_schema is None:
+            _register_raw_body_schemas(_fastapi_openapi())
+        return cast(dict[str, Any], app.openapi_schema)
+
+    app.openapi = _openapi
 
     @app.get("/health")
-    async def health() -> dict[str, str]:
-        return {"status": "ok"}
+    async def health() -> Response:
+        return Response(content=_HEALTH_BODY, media_type="application/json")
 
     @app.post("/measurements/preview")
     async def preview_measurement(file: UploadFile) -> dict[str, Any]:
-        data = await file.read()
         filename = (file.filename or "").lower()
         try:
-            if filename.endswith(".mdat"):
-                trace = parse_rew_mdat(data)
-            else:
-                try:
-                    text = data.decode("utf-8")
-                except UnicodeDecodeError:
-                    text = data.decode("latin-1")
-                trace = parse_klippel_dat(text)
+            trace = await run_in_threadpool(_parse_measurement_upload, filename, file.file)
         except Exception as exc:  # pragma: no cover - runtime validation
             raise HTTPException(status_code=400, detail=f"Failed to parse measurement: {exc}") from exc
         return {"measurement": trace.to_dict()}
 
-    @app.post("/measurements/sealed/compare")
-    async def compare_sealed_measurement(payload: SealedMeasurementRequest) -> dict[str, Any]:
-        measurement = _measurement_from_payload(payload.measurement)
-        measurement = _band_limited_measurement(
-            measurement, payload.min_frequency_hz, payload.max_frequency_hz
-        )
-        driver = payload.driver.to_driver()
-        box = payload.box.to_box()
-        return _measurement_comparison_payload(
-            alignment="sealed",
-            driver=driver,
-            box=box,
-            measurement=measurement,
-            mic_distance_m=payload.mic_distance_m,
-            drive_voltage=payload.drive_voltage,
-            apply_overrides=payload.apply_overrides,
-            smoothing_fraction=payload.smoothing_fraction,
+    @app.post(
+        "/measurements/sealed/compare",
+        openapi_extra=_json_body_openapi(SealedMeasurementRequest),
+    )
+    async def compare_sealed_measurement(request: Request) -> Response:
+        return await _cached_json_response(
+            request,
+            app.state.response_cache,
+            partial(_compare_measurement_body, SealedMeasurementRequest, "sealed"),
         )
 
-    @app.post("/measurements/vented/compare")
-    async def compare_vented_measurement(payload: VentedMeasurementRequest) -> dict[str, Any]:
-        measurement = _measurement_from_payload(payload.measurement)
-        measurement = _band_limited_measurement(
-            measurement, payload.min_frequency_hz, payload.max_frequency_hz
-        )
-        driver = payload.driver.to_driver()
-        box = payload.box.to_box()
-        return _measurement_comparison_payload(
-            alignment="vented",
-            driver=driver,
-            box=box,
-            measurement=measurement,
-            mic_distance_m=payload.mic_distance_m,
-            drive_voltage=payload.drive_voltage,
-            apply_overrides=payload.apply_overrides,
-            smoothing_fraction=payload.smoothing_fraction,
+    @app.post(
+        "/measurements/vented/compare",
+        openapi_extra=_json_body_openapi(VentedMeasurementRequest),
+    )
+    async def compare_vented_measurement(request: Request) -> Response:
+        return await _cached_json_response(
+            request,
+            app.state.response_cache,
+            partial(_compare_measurement_body, VentedMeasurementRequest, "vented"),
         )
 
-    @app.post("/simulate/sealed")
-    async def simulate_sealed(payload: SealedRequest) -> dict[str, Any]:
-        solver = SealedBoxSolver(
-            payload.driver.to_driver(),
-            payload.box.to_box(),
-            drive_voltage=payload.drive_voltage,
-        )
-        response = solver.frequency_response(payload.frequencies_hz, payload.mic_distance_m)
-        summary = solver.alignment_summary(response)
-        payload_dict: dict[str, Any] = dict(response.to_dict())
-        payload_dict.update(
-            {
-                "summary": summary.to_dict(),
-                "fc_hz": summary.fc_hz,
-                "qtc": summary.qtc,
-                "excursion_ratio": summary.excursion_ratio,
-                "excursion_headroom_db": summary.excursion_headroom_db,
-                "safe_drive_voltage_v": summary.safe_drive_voltage_v,
-            }
-        )
-        return payload_dict
+    @app.post("/simulate/sealed", openapi_extra=_json_body_openapi(SealedRequest))
+    async def simulate_sealed(request: Request) -> Response:
+        return await _cached_json_response(request, app.state.response_cache, _simulate_sealed_body)
 
-    @app.post("/simulate/vented")
-    async def simulate_vented(payload: VentedRequest) -> dict[str, Any]:
-        solver = VentedBoxSolver(
-            payload.driver.to_driver(),
-            payload.box.to_box(),
-            drive_voltage=payload.drive_voltage,
-        )
-        response = solver.frequency_response(payload.frequencies_hz, payload.mic_distance_m)
-        summary = solver.alignment_summary(response)
-        payload_dict: dict[str, Any] = dict(response.to_dict())
-        payload_dict.update(
-            {
-                "summary": summary.to_dict(),
-                "fb_hz": summary.fb_hz,
-                "max_port_velocity_ms": summary.max_port_velocity_ms,
-                "excursion_ratio": summary.excursion_ratio,
-                "excursion_headroom_db": summary.excursion_headroom_db,
-                "safe_drive_voltage_v": summary.safe_drive_voltage_v,
-            }
-        )
-        return payload_dict
+    @app.post("/simulate/vented", openapi_extra=_json_body_openapi(VentedRequest))
+    async def simulate_vented(request: Request) -> Response:
+        return await _cached_json_response(request, app.state.response_cache, _simulate_vented_body)
 
-    @app.post("/simulate/hybrid")
-    async def simulate_hybrid(payload: HybridRequest) -> dict[str, Any]:
-        alignment, solver = _hybrid_solver_from_request(payload)
-        result, summary = solver.frequency_response(
-            payload.frequencies_hz,
-            mic_distance_m=payload.mic_distance_m,
-            snapshot_stride=payload.snapshot_stride,
-        )
-        include_snapshots = payload.include_snapshots
-
-        response_payload = result.to_dict(include_snapshots=include_snapshots)
-        if not include_snapshots:
-            response_payload["field_snapshots"] = [
-                snapshot.to_dict(include_pressure=False) for snapshot in result.field_snapshots
-            ]
-
-        summary_dict = summary.to_dict()
-        response_payload.update(
-            {
-                "summary": summary_dict,
-                "alignment": alignment,
-                "grid_resolution": solver.grid_resolution,
-                "snapshot_stride": result.snapshot_stride,
-                "snapshot_count": len(result.field_snapshots),
-                "suspension_creep": payload.suspension_creep,
-                "plane_metrics": {
-                    label: {
-                        "max_pressure_pa": summary.plane_max_pressure_pa[label],
-                        "mean_pressure_pa": summary.plane_mean_pressure_pa[label],
-                        "max_pressure_coords_m": list(
-                            summary.plane_max_pressure_location_m.get(label, (0.0, 0.0, 0.0))
-                        ),
-                    }
-                    for label in summary.plane_max_pressure_pa
-                },
-            }
-        )
-        return response_payload
+    @app.post("/simulate/hybrid", openapi_extra=_json_body_openapi(HybridRequest))
+    async def simulate_hybrid(request: Request) -> Response:
+        return await _cached_json_response(request, app.state.response_cache, _simulate_hybrid_body)
 
     @app.post("/simulate/sealed/tolerances")
     async def sealed_tolerances(payload: SealedToleranceRequest) -> dict[str, Any]:
         spec = _tolerance_spec_from_payload(payload.tolerances)
-        report = run_tolerance_analysis(
+        report = await run_in_threadpool(
+            run_tolerance_analysis,
             "sealed",
             payload.driver.to_driver(),
             payload.box.to_box(),
@@ -836,13 +1273,16 @@ if FastAPI is not None:  # pragma: no branch
             drive_voltage=payload.drive_voltage,
             mic_distance_m=payload.mic_distance_m,
             excursion_limit_ratio=payload.excursion_limit,
+            executor=app.state.tolerance_pool,
+            chunks=_TOLERANCE_CHUNKS,
         )
         return report.to_dict()
 
     @app.post("/simulate/vented/tolerances")
     async def vented_tolerances(payload: VentedToleranceRequest) -> dict[str, Any]:
         spec = _tolerance_spec_from_payload(payload.tolerances)
-        report = run_tolerance_analysis(
+        report = await run_in_threadpool(
+            run_tolerance_analysis,
             "vented",
             payload.driver.to_driver(),
             payload.box.to_box(),
@@ -853,19 +1293,27 @@ if FastAPI is not None:  # pragma: no branch
             mic_distance_m=payload.mic_distance_m,
             excursion_limit_ratio=payload.excursion_limit,
             port_velocity_limit_ms=payload.port_velocity_limit_ms,
+            executor=app.state.tolerance_pool,
+            chunks=_TOLERANCE_CHUNKS,
         )
         return report.to_dict()
 
     @app.post("/opt/start")
-    async def start_optimisation(payload: OptimizationParams, background: BackgroundTasks) -> dict[str, Any]:
+    async def start_optimisation(payload: OptimizationParams) -> dict[str, Any]:
         params = payload.to_dict()
         assert _store is not None  # mypy hint
+        # The run stays queued until a pool worker picks it up.
         record = _store.create_run(params)
-        background.add_task(_run_optimisation_task, record.id, params)
+        _submit_optimisation(app.state.opt_pool, _store, record.id, params)
         return record.to_dict()
 
     @app.get("/opt/runs")
-    async def list_runs(limit: int = 20, status: str | None = None) -> dict[str, Any]:
+    async def list_runs(
+        limit: int = 20,
+        status: str | None = None,
+        before: float | None = None,
+        before_id: str | None = None,
+    ) -> dict[str, Any]:
         assert _store is not None
         status_filter = None
         if status is not None:
@@ -875,10 +1323,20 @@ if FastAPI is not None:  # pragma: no branch
             status_filter = status_lower
         runs = [
             record.to_dict()
-            for record in _store.list_runs(limit=limit, status=status_filter)
+            for record in _store.list_runs(
+                limit=limit, status=status_filter, before=before, before_id=before_id
+            )
         ]
         return {"runs": runs}
 
+    # Registered before /opt/{run_id}, which would otherwise capture "stats".
+    @app.get("/opt/stats")
+    async def optimisation_stats() -> dict[str, Any]:
+        assert _store is not None
+        counts = _store.status_counts()
+        total = sum(counts.values())
+        return {"counts": counts, "total": total}
+
     @app.get("/opt/{run_id}")
     async def fetch_run(run_id: str) -> dict[str, Any]:
         assert _store is not None
@@ -887,29 +1345,20 @@ if FastAPI is not None:  # pragma: no branch
             raise HTTPException(status_code=404, detail="Run not found")
         return record.to_dict()
 
-    @app.get("/opt/stats")
-    async def optimisation_stats() -> dict[str, Any]:
-        assert _store is not None
-        counts = _store.status_counts()
-        total = sum(counts.values())
-        return {"counts": counts, "total": total}
-
     @app.get("/schemas/solvers")
-    async def list_solver_schemas() -> dict[str, Any]:
+    async def list_solver_schemas() -> Response:
         """Return the JSON schema catalog for sealed and vented solvers."""
 
-        return {"solvers": solver_schema_catalog()}
+        return Response(content=_solver_schema_catalog_body(), media_type="application/json")
 
     @app.get("/schemas/solvers/{alignment}")
-    async def fetch_solver_schema(alignment: str) -> dict[str, Any]:
+    async def fetch_solver_schema(alignment: str) -> Response:
         """Return the JSON schemas for a specific solver alignment."""
 
-        catalog = solver_schema_catalog()
-        key = alignment.lower()
-        entry = catalog.get(key)
-        if entry is None:
+        body = _solver_schema_bodies().get(alignment.lower())
+        if body is None:
             raise HTTPException(status_code=404, detail="Solver alignment not found")
-        return {"alignment": key, "request": entry["request"], "response": entry["response"]}
+        return Response(content=body, media_type="application/json")
 else:  # pragma: no cover
     app = None
 
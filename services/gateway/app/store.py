@@ -7,25 +7,73 @@ import sqlite3
 import threading
 import time
 import uuid
-from dataclasses import dataclass
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
+
+try:  # pragma: no cover - optional accelerator
+    import orjson
+except ImportError:  # pragma: no cover - fallback to stdlib json
+    orjson = cast(Any, None)
 
 DEFAULT_DB_PATH = Path(__file__).resolve().parent / "gateway.db"
 VALID_STATUSES = {"queued", "running", "succeeded", "failed"}
+_UNDECODED: Any = object()
+
+
+def _dumps(value: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(value).decode()
+    return json.dumps(value)
+
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+_INSERT_RUN_SQL = (
+    "INSERT INTO runs (id, status, created_at, updated_at, params, result, error) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+_SELECT_RUNS_SQL = "SELECT id, status, created_at, updated_at, params, result, error FROM runs"
+_UPDATE_STATUS_SQL = (
+    "UPDATE runs SET status = ?, updated_at = ?, result = ?, error = ? WHERE id = ? RETURNING id"
+)
+# ``RETURNING`` needs SQLite 3.35+; older builds fall back to ``cursor.rowcount``.
+if sqlite3.sqlite_version_info < (3, 35, 0):  # pragma: no cover - legacy SQLite
+    _UPDATE_STATUS_SQL = _UPDATE_STATUS_SQL.removesuffix(" RETURNING id")
 
 
 @dataclass(slots=True)
 class RunRecord:
-    """Represents a persisted optimisation run."""
+    """Represents a persisted optimisation run.
+
+    ``params`` and ``result`` are stored as the JSON text read from SQLite and
+    decoded on first access, so listings that only touch the header columns
+    never pay for parsing the payloads.
+    """
 
     id: str
     status: str
     created_at: float
     updated_at: float
-    params: dict[str, Any]
-    result: dict[str, Any] | None
+    params_json: str
+    result_json: str | None
     error: str | None
+    _params: dict[str, Any] | None = field(default=None, init=False, repr=False, compare=False)
+    _result: Any = field(default=_UNDECODED, init=False, repr=False, compare=False)
+
+    @property
+    def params(self) -> dict[str, Any]:
+        if self._params is None:
+            self._params = _loads(self.params_json) if self.params_json else {}
+        return self._params
+
+    @property
+    def result(self) -> dict[str, Any] | None:
+        if self._result is _UNDECODED:
+            self._result = _loads(self.result_json) if self.result_json else None
+        return cast("dict[str, Any] | None", self._result)
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -40,60 +88,144 @@ class RunRecord:
 
 
 class RunStore:
-    """Lightweight SQLite-backed store for optimisation runs."""
+    """Lightweight SQLite-backed store for optimisation runs.
+
+    The database runs in WAL mode so readers never block the writer, and each
+    thread keeps one long-lived autocommit connection instead of reconnecting
+    per call; :meth:`transaction` groups several writes into a single commit.
+    """
 
-    def __init__(self, db_path: str | Path | None = None) -> None:
+    def __init__(self, db_path: str | Path | None = None, *, counts_ttl_s: float = 1.0) -> None:
         self._path = Path(db_path) if db_path else DEFAULT_DB_PATH
         parent = self._path.parent
         if str(parent) not in {"", "."} and not parent.exists():
             parent.mkdir(parents=True, exist_ok=True)
-        self._lock = threading.Lock()
+        # Serialises writers only; reads go lock-free through their own connection.
+        self._write_lock = threading.RLock()
+        self._pool_lock = threading.Lock()
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._generation = 0
+        # Dashboards poll the counts; a short TTL is plenty and writes invalidate it.
+        self._counts_ttl_s = counts_ttl_s
+        self._counts_cache: tuple[float, dict[str, int]] | None = None
         self._ensure_schema()
 
+    @property
+    def path(self) -> Path:
+        return self._path
+
     def _connect(self) -> sqlite3.Connection:
+        local = self._local
+        conn: sqlite3.Connection | None = getattr(local, "conn", None)
+        if conn is not None and local.generation == self._generation:
+            return conn
         conn = sqlite3.connect(
             str(self._path), timeout=30, isolation_level=None, check_same_thread=False
         )
         conn.row_factory = sqlite3.Row
+        # WAL only needs the log synced at checkpoints to stay crash-consistent.
+        conn.execute("PRAGMA synchronous=NORMAL")
+        with self._pool_lock:
+            self._connections.append(conn)
+            local.conn = conn
+            local.generation = self._generation
         return conn
 
+    def close(self) -> None:
+        """Close every pooled connection; later calls transparently reconnect."""
+
+        with self._pool_lock:
+            connections, self._connections = self._connections, []
+            self._generation += 1
+        for conn in connections:
+            conn.close()
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Group the writes made by this thread inside the block into one commit."""
+
+        with self._write_lock:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+            # Readers may have cached counts between the inner writes and the commit.
+            self._counts_cache = None
+
     def _ensure_schema(self) -> None:
-        with self._connect() as conn:
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS runs (
-                    id TEXT PRIMARY KEY,
-                    status TEXT NOT NULL,
-                    created_at REAL NOT NULL,
-                    updated_at REAL NOT NULL,
-                    params TEXT NOT NULL,
-                    result TEXT,
-                    error TEXT
-                )
-                """
+        conn = self._connect()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS runs (
+                id TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL,
+                params TEXT NOT NULL,
+                result TEXT,
+                error TEXT
             )
+            """
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_runs_status_created"
+            " ON runs (status, created_at DESC, id DESC)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_runs_created ON runs (created_at DESC, id DESC)"
+        )
 
     def create_run(self, params: dict[str, Any]) -> RunRecord:
+        record = self._new_record(params)
+        with self._write_lock:
+            self._connect().execute(_INSERT_RUN_SQL, self._insert_row(record))
+            self._counts_cache = None
+        return record
+
+    def create_runs(self, params_list: Iterable[dict[str, Any]]) -> list[RunRecord]:
+        """Insert several queued runs with one ``executemany`` and a single commit."""
+
+        records = [self._new_record(params) for params in params_list]
+        if not records:
+            return records
+        with self.transaction():
+            self._connect().executemany(_INSERT_RUN_SQL, map(self._insert_row, records))
+        return records
+
+    @staticmethod
+    def _new_record(params: dict[str, Any]) -> RunRecord:
         now = time.time()
-        run_id = uuid.uuid4().hex
+        params = dict(params)
         record = RunRecord(
-            id=run_id,
+            id=uuid.uuid4().hex,
             status="queued",
             created_at=now,
             updated_at=now,
-            params=dict(params),
-            result=None,
+            params_json=_dumps(params),
+            result_json=None,
             error=None,
         )
-        payload = (run_id, record.status, now, now, json.dumps(record.params), None, None)
-        with self._lock:
-            with self._connect() as conn:
-                conn.execute(
-                    "INSERT INTO runs (id, status, created_at, updated_at, params, result, error) VALUES (?, ?, ?, ?, ?, ?, ?)",
-                    payload,
-                )
+        record._params = params
         return record
 
+    @staticmethod
+    def _insert_row(record: RunRecord) -> tuple[Any, ...]:
+        return (
+            record.id,
+            record.status,
+            record.created_at,
+            record.updated_at,
+            record.params_json,
+            None,
+            None,
+        )
+
     def mark_running(self, run_id: str) -> None:
         self._update_status(run_id, "running", result=None, error=None)
 
@@ -112,66 +244,90 @@ class RunStore:
         error: str | None,
     ) -> None:
         now = time.time()
-        result_json = json.dumps(result) if result is not None else None
-        with self._lock:
-            with self._connect() as conn:
-                cursor = conn.execute(
-                    "UPDATE runs SET status = ?, updated_at = ?, result = ?, error = ? WHERE id = ?",
-                    (status, now, result_json, error, run_id),
-                )
-                if cursor.rowcount == 0:
-                    raise KeyError(f"Unknown run id: {run_id}")
+        result_json = _dumps(result) if result is not None else None
+        with self._write_lock:
+            cursor = self._connect().execute(
+                _UPDATE_STATUS_SQL, (status, now, result_json, error, run_id)
+            )
+            # Draining the cursor also finishes the statement so it releases its lock.
+            updated = cursor.fetchall() if cursor.description else cursor.rowcount
+            if not updated:
+                raise KeyError(f"Unknown run id: {run_id}")
+            self._counts_cache = None
 
     def get_run(self, run_id: str) -> RunRecord | None:
-        with self._connect() as conn:
-            row = conn.execute("SELECT * FROM runs WHERE id = ?", (run_id,)).fetchone()
+        row = self._connect().execute(_SELECT_RUNS_SQL + " WHERE id = ?", (run_id,)).fetchone()
         if row is None:
             return None
         return self._row_to_record(row)
 
-    def list_runs(self, *, limit: int = 20, status: str | None = None) -> list[RunRecord]:
+    def list_runs(
+        self,
+        *,
+        limit: int = 20,
+        status: str | None = None,
+        before: float | None = None,
+        before_id: str | None = None,
+    ) -> list[RunRecord]:
+        """Return the newest runs first, ordered by ``(created_at, id)``.
+
+        ``before``/``before_id`` form a keyset cursor: pass the ``created_at``
+        and ``id`` of the last run from the previous page to fetch the next
+        one. The id breaks ties between runs created in the same clock tick;
+        without it, ``before`` alone skips every run sharing that timestamp.
+        """
+
         if status is not None and status not in VALID_STATUSES:
             raise ValueError(f"Unsupported status filter: {status}")
 
+        clauses: list[str] = []
         params: list[Any] = []
-        query = "SELECT * FROM runs"
         if status is not None:
-            query += " WHERE status = ?"
+            clauses.append("status = ?")
             params.append(status)
-        query += " ORDER BY created_at DESC LIMIT ?"
+        if before is not None and before_id is not None:
+            clauses.append("(created_at, id) < (?, ?)")
+            params.extend((before, before_id))
+        elif before is not None:
+            clauses.append("created_at < ?")
+            params.append(before)
+        query = _SELECT_RUNS_SQL
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY created_at DESC, id DESC LIMIT ?"
         params.append(max(limit, 1))
 
-        with self._connect() as conn:
-            rows = conn.execute(query, tuple(params)).fetchall()
+        rows = self._connect().execute(query, tuple(params)).fetchall()
         return [self._row_to_record(row) for row in rows]
 
     def status_counts(self) -> dict[str, int]:
-        with self._connect() as conn:
-            rows = conn.execute(
-                "SELECT status, COUNT(*) as count FROM runs GROUP BY status"
-            ).fetchall()
+        cached = self._counts_cache
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < self._counts_ttl_s:
+            return dict(cached[1])
+        rows = self._connect().execute(
+            "SELECT status, COUNT(*) as count FROM runs GROUP BY status"
+        ).fetchall()
         counts: dict[str, int] = {status: 0 for status in VALID_STATUSES}
         for row in rows:
             counts[row["status"]] = int(row["count"])
-        return counts
+        self._counts_cache = (now, counts)
+        return dict(counts)
 
     def delete_all(self) -> None:
-        with self._lock:
-            with self._connect() as conn:
-                conn.execute("DELETE FROM runs")
+        with self._write_lock:
+            self._connect().execute("DELETE FROM runs")
+            self._counts_cache = None
 
     def _row_to_record(self, row: sqlite3.Row) -> RunRecord:
-        params = json.loads(row["params"]) if row["params"] else {}
-        result = json.loads(row["result"]) if row["result"] else None
-        error = row["error"] if row["error"] else None
         return RunRecord(
             id=row["id"],
             status=row["status"],
             created_at=row["created_at"],
             updated_at=row["updated_at"],
-            params=params,
-            result=result,
-            error=error,
+            params_json=row["params"],
+            result_json=row["result"],
+            error=row["error"] if row["error"] else None,
         )
 
 